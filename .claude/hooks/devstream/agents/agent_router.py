@@ -11,7 +11,7 @@ Decision Threshold: ≥0.95 confidence + LOW complexity + NONE/LOW impact
 
 Usage:
     router = AgentRouter()
-    assessment = await router.assess_task_complexity(pattern_match, context)
+    assessment = router.assess_task_complexity(pattern_match, context)
     if router.should_auto_approve(assessment):
         # Auto-delegate to agent
     else:
@@ -19,16 +19,187 @@ Usage:
         message = router.format_advisory_message(assessment)
 """
 
-from typing import Optional, Dict, Any, Literal, List
+from typing import Optional, Dict, Any, Literal, Tuple, Union
 from dataclasses import dataclass
+from enum import IntEnum
 from .pattern_catalog import PatternMatch
 
 
-@dataclass
+class _Level(IntEnum):
+    """
+    Ordered assessment level that renders as its name in messages and logs.
+
+    Levels also compare equal to their name (``Complexity.LOW == "LOW"``) so
+    callers written against the former string levels keep working. The hash
+    is the name's hash, so equality is limited to the name and the member
+    itself: a level never equals a plain int, which keeps dict and set
+    lookups consistent. Ordering (``<``, ``<=``) stays integer-based.
+    """
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.name, format_spec)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, str):
+            return self.name == other
+        return self is other
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+
+class Complexity(_Level):
+    """Task complexity level (LOW <30min, MEDIUM <2h, HIGH >2h)."""
+
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+
+
+class ArchitecturalImpact(_Level):
+    """Impact of a task on system architecture."""
+
+    NONE = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+
+
+def _render_advisory_templates() -> Dict[Tuple[str, bool], str]:
+    """
+    Pre-render advisory message templates for str.format_map.
+
+    Returns:
+        Mapping of (recommendation, has_suggested_agent) to message template
+    """
+    actions = {
+        "DELEGATE": "✅ Auto-delegation approved to {suggested_agent}",
+        "COORDINATE": "⚠️ Coordination recommended with {suggested_agent} (review suggested)",
+        "ESCALATE": "🚨 Full @tech-lead analysis required (high complexity/impact)"
+    }
+
+    templates = {}
+    for recommendation, action in actions.items():
+        for has_agent in (True, False):
+            header = f"ADVISORY: {recommendation}"
+            if has_agent:
+                header += " with {suggested_agent}"
+
+            templates[(recommendation, has_agent)] = "\n".join([
+                header,
+                "",
+                "Metrics:",
+                "  • Confidence: {confidence:.2f}",
+                "  • Complexity: {complexity}",
+                "  • Architectural Impact: {architectural_impact}",
+                "",
+                "Reasoning: {reason}",
+                "",
+                f"Action: {action}"
+            ])
+
+    return templates
+
+
+# Advisory templates keyed by (recommendation, has_suggested_agent)
+_ADVISORY_TEMPLATES = _render_advisory_templates()
+
+
+def _render_reason_suffixes() -> Dict[
+    Tuple[Complexity, ArchitecturalImpact, str], str
+]:
+    """
+    Pre-render the assessment reason text that follows the pattern match reason.
+
+    Returns:
+        Mapping of (complexity, impact, recommendation) to reason suffix
+    """
+    complexity_context = {
+        Complexity.LOW: "single-file, well-defined scope",
+        Complexity.MEDIUM: "multi-file or moderate scope",
+        Complexity.HIGH: "complex refactoring or broad scope"
+    }
+    impact_context = {
+        ArchitecturalImpact.NONE: "no architectural impact",
+        ArchitecturalImpact.LOW: "minor component changes",
+        ArchitecturalImpact.MEDIUM: "new components or API changes",
+        ArchitecturalImpact.HIGH: "core architecture modifications"
+    }
+    recommendation_context = {
+        "DELEGATE": "Auto-delegation criteria met (high confidence, low risk)",
+        "COORDINATE": "Coordination recommended (moderate complexity/impact)",
+        "ESCALATE": "Full analysis required (high complexity/impact or low confidence)"
+    }
+
+    return {
+        (complexity, impact, recommendation): "; ".join([
+            f"Task complexity: {complexity} ({complexity_context[complexity]})",
+            f"Architectural impact: {impact} ({impact_context[impact]})",
+            recommendation_text
+        ])
+        for complexity in Complexity
+        for impact in ArchitecturalImpact
+        for recommendation, recommendation_text in recommendation_context.items()
+    }
+
+
+# Reason suffixes keyed by (complexity, architectural_impact, recommendation)
+_REASON_SUFFIXES = _render_reason_suffixes()
+
+
+@dataclass(frozen=True, slots=True)
+class AssessmentContext:
+    """
+    Tool execution signals used to assess a task.
+
+    Built once at the hook boundary so the router reads slots instead of
+    probing a dict for each signal.
+
+    Attributes:
+        file_path: File being modified (if any)
+        user_query: User query string
+        tool_name: Tool being invoked (if any)
+        affected_files: All files touched by the task
+    """
+
+    file_path: Optional[str] = None
+    user_query: str = ""
+    tool_name: Optional[str] = None
+    affected_files: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, context: Dict[str, Any]) -> "AssessmentContext":
+        """
+        Build from a legacy context dict.
+
+        Args:
+            context: Dict with optional file_path, user_query, tool_name
+                and affected_files keys (other keys are ignored)
+
+        Returns:
+            Equivalent AssessmentContext
+        """
+        return cls(
+            file_path=context.get("file_path"),
+            user_query=context.get("user_query") or "",
+            tool_name=context.get("tool_name"),
+            affected_files=tuple(context.get("affected_files") or ())
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class TaskAssessment:
     """
     Task complexity and delegation assessment result.
 
+    Immutable, so an assessment cannot change after it has been logged.
+
     Attributes:
         complexity: Task complexity level (LOW <30min, MEDIUM <2h, HIGH >2h)
         architectural_impact: Impact on system architecture
@@ -38,8 +209,8 @@ class TaskAssessment:
         reason: Human-readable explanation of assessment
     """
 
-    complexity: Literal["LOW", "MEDIUM", "HIGH"]
-    architectural_impact: Literal["NONE", "LOW", "MEDIUM", "HIGH"]
+    complexity: Complexity
+    architectural_impact: ArchitecturalImpact
     recommendation: Literal["DELEGATE", "COORDINATE", "ESCALATE"]
     suggested_agent: Optional[str]
     confidence: float
@@ -60,13 +231,47 @@ class AgentRouter:
 
     # Auto-approval thresholds (configurable)
     AUTO_APPROVE_CONFIDENCE_THRESHOLD = 0.95
-    AUTO_APPROVE_MAX_COMPLEXITY = "LOW"
-    AUTO_APPROVE_MAX_IMPACT = "LOW"
-
-    async def assess_task_complexity(
+    AUTO_APPROVE_MAX_COMPLEXITY = Complexity.LOW
+    AUTO_APPROVE_MAX_IMPACT = ArchitecturalImpact.LOW
+
+    # Below this confidence every task escalates
+    ESCALATE_CONFIDENCE_THRESHOLD = 0.85
+
+    # Keyword signals (lowercase, matched as substrings of the lowercased query)
+    HIGH_COMPLEXITY_KEYWORDS = frozenset({
+        "refactor", "migrate", "redesign", "architecture",
+        "multi-service", "distributed", "microservice"
+    })
+    MEDIUM_COMPLEXITY_KEYWORDS = frozenset({
+        "multiple", "several", "batch", "update all",
+        "integrate", "connect", "extend"
+    })
+    HIGH_IMPACT_KEYWORDS = frozenset({
+        "migration", "migrate", "migrating",  # Database/infrastructure changes
+        "breaking change", "architecture",
+        "redesign", "refactor architecture",
+        "new service",  # Microservice creation
+        "service", "microservice",  # Service-level changes (when combined with "new", "create")
+        "new database", "database schema",
+        "authentication system", "authorization system",
+        "auth system"
+    })
+    MEDIUM_IMPACT_KEYWORDS = frozenset({
+        "new api", "new endpoint", "new feature",
+        "integration", "integrate", "integrating",  # Third-party integrations (verb/noun forms)
+        "third-party", "external api", "external service",
+        "webhook", "webhooks",
+        "api endpoint"
+    })
+    LOW_IMPACT_KEYWORDS = frozenset({
+        "fix", "update", "improve", "optimize",
+        "test", "document", "refactor function"
+    })
+
+    def assess_task_complexity(
         self,
         pattern_match: PatternMatch,
-        context: Dict[str, Any]
+        context: Union[AssessmentContext, Dict[str, Any]]
     ) -> TaskAssessment:
         """
         Assess task complexity and delegation suitability.
@@ -79,12 +284,8 @@ class AgentRouter:
 
         Args:
             pattern_match: Pattern match result from PatternMatcher
-            context: Tool execution context containing:
-                - file_path: Optional file path
-                - content: Optional file content
-                - user_query: Optional user query
-                - tool_name: Optional tool name
-                - affected_files: Optional list of affected files
+            context: AssessmentContext, or an equivalent dict with optional
+                file_path, user_query, tool_name and affected_files keys
 
         Returns:
             TaskAssessment with complexity, impact, and recommendation
@@ -95,25 +296,30 @@ class AgentRouter:
         if not pattern_match:
             raise ValueError("pattern_match cannot be None")
 
-        # Extract context signals
-        file_path = context.get("file_path")
-        user_query = context.get("user_query", "")
-        affected_files = context.get("affected_files", [])
-        tool_name = context.get("tool_name")
+        if not isinstance(context, AssessmentContext):
+            context = AssessmentContext.from_dict(context)
+        file_path = context.file_path
+
+        # Only the file count matters for complexity; fall back to the
+        # single file_path when no affected_files list is provided
+        affected_files = context.affected_files
+        file_count = len(affected_files) if affected_files else (1 if file_path else 0)
+
+        # Lowercase once; both keyword assessments scan the same query
+        query_lower = context.user_query.lower()
 
         # Assess complexity based on signals
         complexity = self._assess_complexity_signals(
             pattern_match=pattern_match,
-            user_query=user_query,
-            file_path=file_path,
-            affected_files=affected_files
+            query_lower=query_lower,
+            file_count=file_count
         )
 
         # Assess architectural impact
         architectural_impact = self._assess_architectural_impact(
-            user_query=user_query,
+            query_lower=query_lower,
             file_path=file_path,
-            tool_name=tool_name
+            tool_name=context.tool_name
         )
 
         # Determine recommendation
@@ -157,8 +363,8 @@ class AgentRouter:
 
         Example:
             >>> assessment = TaskAssessment(
-            ...     complexity="LOW",
-            ...     architectural_impact="NONE",
+            ...     complexity=Complexity.LOW,
+            ...     architectural_impact=ArchitecturalImpact.NONE,
             ...     recommendation="DELEGATE",
             ...     suggested_agent="@python-specialist",
             ...     confidence=0.95,
@@ -167,10 +373,12 @@ class AgentRouter:
             >>> router.should_auto_approve(assessment)
             True
         """
+        # Confidence first: it rejects most tasks, so the level checks
+        # are usually short-circuited
         return (
             assessment.confidence >= self.AUTO_APPROVE_CONFIDENCE_THRESHOLD
-            and assessment.complexity == self.AUTO_APPROVE_MAX_COMPLEXITY
-            and assessment.architectural_impact in ["NONE", self.AUTO_APPROVE_MAX_IMPACT]
+            and assessment.complexity <= self.AUTO_APPROVE_MAX_COMPLEXITY
+            and assessment.architectural_impact <= self.AUTO_APPROVE_MAX_IMPACT
         )
 
     def format_advisory_message(self, assessment: TaskAssessment) -> str:
@@ -195,50 +403,24 @@ class AgentRouter:
             >>> router.format_advisory_message(assessment)
             "ADVISORY: COORDINATE with @python-specialist\\n..."
         """
-        # Header with recommendation
-        header = f"ADVISORY: {assessment.recommendation}"
-        if assessment.suggested_agent:
-            header += f" with {assessment.suggested_agent}"
-
-        # Metrics section
-        metrics = [
-            f"Confidence: {assessment.confidence:.2f}",
-            f"Complexity: {assessment.complexity}",
-            f"Architectural Impact: {assessment.architectural_impact}"
+        template = _ADVISORY_TEMPLATES[
+            (assessment.recommendation, bool(assessment.suggested_agent))
         ]
 
-        # Reasoning section
-        reasoning = f"Reasoning: {assessment.reason}"
-
-        # Action recommendation
-        if assessment.recommendation == "DELEGATE":
-            action = f"✅ Auto-delegation approved to {assessment.suggested_agent}"
-        elif assessment.recommendation == "COORDINATE":
-            action = f"⚠️ Coordination recommended with {assessment.suggested_agent} (review suggested)"
-        else:  # ESCALATE
-            action = "🚨 Full @tech-lead analysis required (high complexity/impact)"
-
-        # Assemble message
-        message = "\n".join([
-            header,
-            "",
-            "Metrics:",
-            *[f"  • {metric}" for metric in metrics],
-            "",
-            reasoning,
-            "",
-            f"Action: {action}"
-        ])
-
-        return message
+        return template.format_map({
+            "suggested_agent": assessment.suggested_agent,
+            "confidence": assessment.confidence,
+            "complexity": assessment.complexity,
+            "architectural_impact": assessment.architectural_impact,
+            "reason": assessment.reason
+        })
 
     def _assess_complexity_signals(
         self,
         pattern_match: PatternMatch,
-        user_query: str,
-        file_path: Optional[str],
-        affected_files: List[str]
-    ) -> Literal["LOW", "MEDIUM", "HIGH"]:
+        query_lower: str,
+        file_count: int
+    ) -> Complexity:
         """
         Assess task complexity from signals.
 
@@ -249,45 +431,35 @@ class AgentRouter:
 
         Args:
             pattern_match: Pattern match result
-            user_query: User query string
-            file_path: Optional file path
-            affected_files: List of affected files
+            query_lower: Lowercased user query (lowercased once at ingress)
+            file_count: Number of affected files (precomputed at ingress)
 
         Returns:
             Complexity level
         """
         # HIGH complexity signals
-        high_complexity_keywords = [
-            "refactor", "migrate", "redesign", "architecture",
-            "multi-service", "distributed", "microservice"
-        ]
-        if any(keyword in user_query.lower() for keyword in high_complexity_keywords):
-            return "HIGH"
+        if any(keyword in query_lower for keyword in self.HIGH_COMPLEXITY_KEYWORDS):
+            return Complexity.HIGH
 
         # File count signal
-        file_count = len(affected_files) if affected_files else (1 if file_path else 0)
         if file_count > 5:
-            return "HIGH"
+            return Complexity.HIGH
         elif file_count >= 2:
-            return "MEDIUM"
+            return Complexity.MEDIUM
 
         # MEDIUM complexity signals
-        medium_complexity_keywords = [
-            "multiple", "several", "batch", "update all",
-            "integrate", "connect", "extend"
-        ]
-        if any(keyword in user_query.lower() for keyword in medium_complexity_keywords):
-            return "MEDIUM"
+        if any(keyword in query_lower for keyword in self.MEDIUM_COMPLEXITY_KEYWORDS):
+            return Complexity.MEDIUM
 
         # Default: LOW complexity (single file, clear pattern)
-        return "LOW"
+        return Complexity.LOW
 
     def _assess_architectural_impact(
         self,
-        user_query: str,
+        query_lower: str,
         file_path: Optional[str],
         tool_name: Optional[str]
-    ) -> Literal["NONE", "LOW", "MEDIUM", "HIGH"]:
+    ) -> ArchitecturalImpact:
         """
         Assess architectural impact from signals.
 
@@ -298,56 +470,33 @@ class AgentRouter:
         - HIGH: Core architecture changes, migrations, breaking changes
 
         Args:
-            user_query: User query string
+            query_lower: Lowercased user query (lowercased once at ingress)
             file_path: Optional file path
             tool_name: Optional tool name
 
         Returns:
             Architectural impact level
         """
-        query_lower = user_query.lower()
-
         # HIGH impact signals
-        high_impact_keywords = [
-            "migration", "migrate", "migrating",  # Database/infrastructure changes
-            "breaking change", "architecture",
-            "redesign", "refactor architecture",
-            "new service",  # Microservice creation
-            "service", "microservice",  # Service-level changes (when combined with "new", "create")
-            "new database", "database schema",
-            "authentication system", "authorization system",
-            "auth system"
-        ]
-        if any(keyword in query_lower for keyword in high_impact_keywords):
-            return "HIGH"
+        if any(keyword in query_lower for keyword in self.HIGH_IMPACT_KEYWORDS):
+            return ArchitecturalImpact.HIGH
 
         # MEDIUM impact signals
-        medium_impact_keywords = [
-            "new api", "new endpoint", "new feature",
-            "integration", "integrate", "integrating",  # Third-party integrations (verb/noun forms)
-            "third-party", "external api", "external service",
-            "webhook", "webhooks",
-            "api endpoint"
-        ]
-        if any(keyword in query_lower for keyword in medium_impact_keywords):
-            return "MEDIUM"
+        if any(keyword in query_lower for keyword in self.MEDIUM_IMPACT_KEYWORDS):
+            return ArchitecturalImpact.MEDIUM
 
         # LOW impact signals
-        low_impact_keywords = [
-            "fix", "update", "improve", "optimize",
-            "test", "document", "refactor function"
-        ]
-        if any(keyword in query_lower for keyword in low_impact_keywords):
-            return "LOW"
+        if any(keyword in query_lower for keyword in self.LOW_IMPACT_KEYWORDS):
+            return ArchitecturalImpact.LOW
 
         # Default: NONE (no clear architectural impact)
-        return "NONE"
+        return ArchitecturalImpact.NONE
 
     def _determine_recommendation(
         self,
         confidence: float,
-        complexity: Literal["LOW", "MEDIUM", "HIGH"],
-        architectural_impact: Literal["NONE", "LOW", "MEDIUM", "HIGH"]
+        complexity: Complexity,
+        architectural_impact: ArchitecturalImpact
     ) -> Literal["DELEGATE", "COORDINATE", "ESCALATE"]:
         """
         Determine delegation recommendation.
@@ -366,14 +515,18 @@ class AgentRouter:
             Delegation recommendation
         """
         # ESCALATE for high complexity/impact or low confidence
-        if complexity == "HIGH" or architectural_impact == "HIGH" or confidence < 0.85:
+        if (
+            complexity == Complexity.HIGH
+            or architectural_impact == ArchitecturalImpact.HIGH
+            or confidence < self.ESCALATE_CONFIDENCE_THRESHOLD
+        ):
             return "ESCALATE"
 
         # DELEGATE for high confidence + low complexity/impact
         if (
             confidence >= self.AUTO_APPROVE_CONFIDENCE_THRESHOLD
-            and complexity == "LOW"
-            and architectural_impact in ["NONE", "LOW"]
+            and complexity <= self.AUTO_APPROVE_MAX_COMPLEXITY
+            and architectural_impact <= self.AUTO_APPROVE_MAX_IMPACT
         ):
             return "DELEGATE"
 
@@ -383,8 +536,8 @@ class AgentRouter:
     def _build_assessment_reason(
         self,
         pattern_match: PatternMatch,
-        complexity: Literal["LOW", "MEDIUM", "HIGH"],
-        architectural_impact: Literal["NONE", "LOW", "MEDIUM", "HIGH"],
+        complexity: Complexity,
+        architectural_impact: ArchitecturalImpact,
         recommendation: Literal["DELEGATE", "COORDINATE", "ESCALATE"]
     ) -> str:
         """
@@ -399,37 +552,7 @@ class AgentRouter:
         Returns:
             Human-readable reason string
         """
-        # Base reason from pattern match
-        base_reason = pattern_match["reason"]
-
-        # Add complexity context
-        complexity_context = {
-            "LOW": "single-file, well-defined scope",
-            "MEDIUM": "multi-file or moderate scope",
-            "HIGH": "complex refactoring or broad scope"
-        }
-
-        # Add impact context
-        impact_context = {
-            "NONE": "no architectural impact",
-            "LOW": "minor component changes",
-            "MEDIUM": "new components or API changes",
-            "HIGH": "core architecture modifications"
-        }
-
-        # Build full reason
-        reason_parts = [
-            base_reason,
-            f"Task complexity: {complexity} ({complexity_context[complexity]})",
-            f"Architectural impact: {architectural_impact} ({impact_context[architectural_impact]})"
-        ]
-
-        # Add recommendation context
-        if recommendation == "DELEGATE":
-            reason_parts.append("Auto-delegation criteria met (high confidence, low risk)")
-        elif recommendation == "COORDINATE":
-            reason_parts.append("Coordination recommended (moderate complexity/impact)")
-        else:
-            reason_parts.append("Full analysis required (high complexity/impact or low confidence)")
-
-        return "; ".join(reason_parts)
+        return "; ".join((
+            pattern_match["reason"],
+            _REASON_SUFFIXES[(complexity, architectural_impact, recommendation)]
+        ))
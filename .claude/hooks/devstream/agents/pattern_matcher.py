@@ -19,10 +19,9 @@ Usage:
         print(f"Agent: {result['agent']}, Confidence: {result['confidence']}")
 """
 
-from typing import Optional, Dict, List, Pattern
+from typing import Optional, Dict, List, Pattern, Tuple
 import re
 import os
-from pathlib import Path
 
 from .pattern_catalog import (
     PatternMatch,
@@ -47,6 +46,45 @@ from .pattern_catalog import (
 )
 
 
+def _file_extension(file_path: str) -> str:
+    """
+    Return the extension of file_path exactly as os.path.splitext would.
+
+    Slices around the last dot instead of building the (root, ext) tuple;
+    leading dots of the basename (e.g. ".bashrc") do not start an extension.
+
+    Args:
+        file_path: File path
+
+    Returns:
+        Extension including the dot, or "" if there is none
+    """
+    dot = file_path.rfind(".")
+    sep = file_path.rfind(os.sep)
+    if os.altsep:
+        sep = max(sep, file_path.rfind(os.altsep))
+
+    # The dot must be in the basename, after at least one non-dot character
+    if dot > sep and file_path[sep + 1:dot].strip("."):
+        return file_path[dot:]
+    return ""
+
+
+# Quality gate results (fixed, so built once and copied per hit)
+_PRE_COMMIT_MATCH = PatternMatch(
+    agent="@code-reviewer",
+    confidence=1.0,
+    reason="Quality gate: Pre-commit code review required",
+    method="mandatory"
+)
+_PRE_MERGE_MATCH = PatternMatch(
+    agent="@code-reviewer",
+    confidence=1.0,
+    reason="Quality gate: Pre-merge review required",
+    method="mandatory"
+)
+
+
 class PatternMatcher:
     """
     Fast pattern-based agent routing (<10ms target).
@@ -64,6 +102,13 @@ class PatternMatcher:
     - Cached keyword extraction
     """
 
+    # Import statements are only looked for in this many leading characters
+    IMPORT_SCAN_LIMIT = 4096
+
+    # Quality gate triggers (substrings of the lowercased tool name)
+    PRE_COMMIT_TRIGGERS = ("git", "commit")
+    PRE_MERGE_TRIGGERS = ("merge", "pull", "pr")
+
     def __init__(self) -> None:
         """Initialize pattern matcher with precompiled regex patterns."""
         # Precompile all import regex patterns for performance
@@ -98,6 +143,46 @@ class PatternMatcher:
             if shebang:
                 self._shebang_patterns[pattern_name] = shebang
 
+        # Prebuilt extension match results, keyed by extension
+        self._extension_matches: Dict[str, PatternMatch] = {
+            ext: PatternMatch(
+                agent=PATTERN_CATALOG[pattern_name]["agent"],
+                confidence=0.95,  # High confidence for exact extension match
+                reason=f"File extension '{ext}' matched {PATTERN_CATALOG[pattern_name]['agent']}",
+                method="extension"
+            )
+            for ext, pattern_name in self._extension_map.items()
+        }
+
+        # Shebang patterns in catalog order, each with its prebuilt result
+        self._shebang_matches: List[Tuple[Pattern[str], PatternMatch]] = [
+            (
+                shebang_pattern,
+                PatternMatch(
+                    agent=PATTERN_CATALOG[pattern_name]["agent"],
+                    confidence=0.90,
+                    reason=f"Shebang matched {PATTERN_CATALOG[pattern_name]['agent']}",
+                    method="shebang"
+                )
+            )
+            for pattern_name, shebang_pattern in self._shebang_patterns.items()
+        ]
+
+        # Import patterns in catalog order, each with its prebuilt result
+        self._import_matches: List[Tuple[Pattern[str], PatternMatch]] = [
+            (
+                import_pattern,
+                PatternMatch(
+                    agent=PATTERN_CATALOG[pattern_name]["agent"],
+                    confidence=0.90,
+                    reason=f"Import statement matched {PATTERN_CATALOG[pattern_name]['agent']}",
+                    method="import"
+                )
+            )
+            for pattern_name, import_patterns in self._import_patterns.items()
+            for import_pattern in import_patterns
+        ]
+
     def match_patterns(
         self,
         file_path: Optional[str] = None,
@@ -173,22 +258,12 @@ class PatternMatcher:
         tool_lower = tool_name.lower()
 
         # Check pre-commit review pattern
-        if "git" in tool_lower or "commit" in tool_lower:
-            return PatternMatch(
-                agent="@code-reviewer",
-                confidence=1.0,
-                reason="Quality gate: Pre-commit code review required",
-                method="mandatory"
-            )
+        if any(keyword in tool_lower for keyword in self.PRE_COMMIT_TRIGGERS):
+            return _PRE_COMMIT_MATCH.copy()
 
         # Check pre-merge review pattern
-        if any(keyword in tool_lower for keyword in ["merge", "pull", "pr"]):
-            return PatternMatch(
-                agent="@code-reviewer",
-                confidence=1.0,
-                reason="Quality gate: Pre-merge review required",
-                method="mandatory"
-            )
+        if any(keyword in tool_lower for keyword in self.PRE_MERGE_TRIGGERS):
+            return _PRE_MERGE_MATCH.copy()
 
         return None
 
@@ -203,6 +278,7 @@ class PatternMatcher:
         Uses fast path:
         1. File extension lookup (O(1)) - Confidence 0.95
         2. Import statement detection - Confidence 0.90
+           (first IMPORT_SCAN_LIMIT characters of content only)
         3. Shebang detection - Confidence 0.90
 
         Args:
@@ -213,41 +289,24 @@ class PatternMatcher:
             PatternMatch for coding pattern or None
         """
         # Fast path: File extension lookup (O(1))
-        _, ext = os.path.splitext(file_path)
-        if ext in self._extension_map:
-            pattern_name = self._extension_map[ext]
-            rule = PATTERN_CATALOG[pattern_name]
-            return PatternMatch(
-                agent=rule["agent"],
-                confidence=0.95,  # High confidence for exact extension match
-                reason=f"File extension '{ext}' matched {rule['agent']}",
-                method="extension"
-            )
+        extension_match = self._extension_matches.get(_file_extension(file_path))
+        if extension_match is not None:
+            return extension_match.copy()
 
         # Check shebang if content provided
         if content:
-            first_line = content.split("\n", 1)[0] if content else ""
-            for pattern_name, shebang_pattern in self._shebang_patterns.items():
+            newline = content.find("\n")
+            first_line = content if newline == -1 else content[:newline]
+            for shebang_pattern, shebang_match in self._shebang_matches:
                 if shebang_pattern.match(first_line):
-                    rule = PATTERN_CATALOG[pattern_name]
-                    return PatternMatch(
-                        agent=rule["agent"],
-                        confidence=0.90,
-                        reason=f"Shebang matched {rule['agent']}",
-                        method="shebang"
-                    )
-
-            # Check import statements
-            for pattern_name, import_patterns in self._import_patterns.items():
-                for import_pattern in import_patterns:
-                    if import_pattern.search(content):
-                        rule = PATTERN_CATALOG[pattern_name]
-                        return PatternMatch(
-                            agent=rule["agent"],
-                            confidence=0.90,
-                            reason=f"Import statement matched {rule['agent']}",
-                            method="import"
-                        )
+                    return shebang_match.copy()
+
+            # Check import statements (first catalog pattern wins);
+            # imports sit at the top of a file, so only the head is scanned
+            content_head = content[:self.IMPORT_SCAN_LIMIT]
+            for import_pattern, import_match in self._import_matches:
+                if import_pattern.search(content_head):
+                    return import_match.copy()
 
         return None
 
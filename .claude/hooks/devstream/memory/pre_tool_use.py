@@ -33,7 +33,7 @@ from mcp_client import get_mcp_client
 # Agent Auto-Delegation imports (with graceful degradation)
 try:
     from agents.pattern_matcher import PatternMatcher
-    from agents.agent_router import AgentRouter, TaskAssessment
+    from agents.agent_router import AgentRouter, AssessmentContext, TaskAssessment
     AGENT_DELEGATION_AVAILABLE = True
 except ImportError as e:
     AGENT_DELEGATION_AVAILABLE = False
@@ -197,15 +197,14 @@ class PreToolUseHook:
                 return None
 
             # Assess task complexity
-            context = {
-                "file_path": file_path,
-                "content": content,
-                "user_query": user_query or "",
-                "tool_name": tool_name,
-                "affected_files": [file_path] if file_path else []
-            }
-
-            assessment = await self.agent_router.assess_task_complexity(
+            context = AssessmentContext(
+                file_path=file_path,
+                user_query=user_query or "",
+                tool_name=tool_name,
+                affected_files=(file_path,) if file_path else ()
+            )
+
+            assessment = self.agent_router.assess_task_complexity(
                 pattern_match=pattern_match,
                 context=context
             )
@@ -264,7 +263,7 @@ class PreToolUseHook:
                 "agent-delegation",
                 agent,
                 recommendation.lower(),
-                complexity.lower()
+                complexity.name.lower()
             ]
 
             # Store in memory via MCP
@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Any, AsyncContextManager, Dict, Optional
 
 import structlog
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection, create_async_engine
 from sqlalchemy.pool import StaticPool, QueuePool
 from devstream.core.config import DatabaseConfig
@@ -31,19 +32,36 @@ class ConnectionPool:
     SQLAlchemy 2.0 async connection pool manager.
 
     Uses create_async_engine with aiosqlite dialect following best practices.
+
+    File databases configured with journal_mode=WAL get a second engine for
+    read_transaction, so readers never wait for a pooled writer connection.
+    Each engine holds up to max_connections, so a WAL pool may open up to
+    2 * max_connections SQLite connections. Without WAL, readers and writers
+    share one engine of max_connections.
     """
 
-    def __init__(self, db_path: str, max_connections: int = 5):
+    def __init__(
+        self,
+        db_path: str,
+        max_connections: int = 5,
+        pragmas: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize connection pool.
 
         Args:
             db_path: Path to SQLite database
-            max_connections: Maximum connections in pool
+            max_connections: Maximum connections per engine (the WAL reader
+                engine has its own max_connections)
+            pragmas: SQLite PRAGMA settings applied to every new connection,
+                e.g. {"journal_mode": "WAL", "synchronous": "NORMAL"}.
+                journal_mode is skipped for :memory: databases.
         """
         self.db_path = Path(db_path)
         self.max_connections = max_connections
+        self.pragmas = dict(pragmas or {})
         self.engine: Optional[AsyncEngine] = None
+        self.read_engine: Optional[AsyncEngine] = None
         self.stats = {
             "connections_created": 0,
             "connections_recycled": 0,
@@ -83,10 +101,50 @@ class ConnectionPool:
 
         self.engine = create_async_engine(database_url, **engine_kwargs)
 
+        # A separate reader engine only pays off under WAL, where readers run
+        # in parallel with an open write transaction. Otherwise (including
+        # :memory:, which shares one StaticPool connection) readers use the
+        # writer engine and the pool stays within max_connections.
+        if self._uses_wal():
+            self.read_engine = create_async_engine(database_url, **engine_kwargs)
+            engines = [self.engine, self.read_engine]
+        else:
+            self.read_engine = self.engine
+            engines = [self.engine]
+
+        if self.pragmas:
+            for engine in engines:
+                self._register_pragmas(engine)
+
         logger.info("SQLAlchemy async engine initialized successfully")
 
+    def _uses_wal(self) -> bool:
+        """Whether connections run in WAL mode (never for :memory:)."""
+        if str(self.db_path) == ":memory:":
+            return False
+        return str(self.pragmas.get("journal_mode", "")).upper() == "WAL"
+
+    def _register_pragmas(self, engine: AsyncEngine) -> None:
+        """Apply configured PRAGMAs on each new DBAPI connection."""
+        pragmas = dict(self.pragmas)
+        if str(self.db_path) == ":memory:":
+            # In-memory databases cannot use WAL
+            pragmas.pop("journal_mode", None)
+        statements = [f"PRAGMA {name}={value}" for name, value in pragmas.items()]
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _apply_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            try:
+                for statement in statements:
+                    cursor.execute(statement)
+            finally:
+                cursor.close()
+
     async def close(self) -> None:
-        """Close the engine and all connections."""
+        """Close the engines and all connections."""
+        if self.read_engine and self.read_engine is not self.engine:
+            await self.read_engine.dispose()
         if self.engine:
             await self.engine.dispose()
             logger.info("Connection pool closed", stats=self.stats)
@@ -99,10 +157,10 @@ class ConnectionPool:
         Returns:
             AsyncConnection for read queries
         """
-        if not self.engine:
+        if not self.read_engine:
             raise DatabaseError("Connection pool not initialized", error_code="POOL_NOT_INIT")
 
-        async with self.engine.connect() as conn:
+        async with self.read_engine.connect() as conn:
             self.stats["read_queries"] += 1
             try:
                 yield conn
@@ -6,10 +6,12 @@ Uses prepared statements and batch operations for performance.
 """
 
 import json
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
+import orjson
 import structlog
 from sqlalchemy import and_, desc, func, or_, select, update, delete, text
 from sqlalchemy.sql import Select
@@ -33,6 +35,43 @@ from devstream.database.schema import (
 logger = structlog.get_logger()
 
 
+# Integer literals too wide for orjson, which reads them back as floats.
+# Float reprs never carry 19 consecutive digits, so only ints (or digit
+# runs inside strings) match.
+_WIDE_INT = re.compile(r"\d{19}")
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Encode a JSON column value as TEXT with orjson.
+
+    Non-string dict keys (e.g. ints) are written as strings, as stdlib json
+    did. NaN and Infinity have no JSON form and are stored as null. Values
+    orjson cannot encode, such as ints wider than 64 bits, fall back to
+    stdlib json.
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(obj)
+
+
+def _loads(data: str) -> Any:
+    """
+    Decode a JSON column value with orjson.
+
+    Rows written by stdlib json may hold NaN or Infinity, which orjson
+    rejects, and wide ints, which orjson would read as floats; both are
+    decoded with stdlib json instead.
+    """
+    if _WIDE_INT.search(data):
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
 class BaseQuery:
     """Base class for database queries with common operations."""
 
@@ -127,13 +166,13 @@ class InterventionPlanQueries(BaseQuery):
             id=plan_id,
             title=title,
             description=description,
-            objectives=json.dumps(objectives),
+            objectives=_dumps(objectives),
             expected_outcome=expected_outcome,
             status=kwargs.get("status", "draft"),
             priority=kwargs.get("priority", 5),
             estimated_hours=kwargs.get("estimated_hours"),
-            tags=json.dumps(kwargs.get("tags", [])),
-            metadata=json.dumps(kwargs.get("metadata", {})),
+            tags=_dumps(kwargs.get("tags", [])),
+            metadata=_dumps(kwargs.get("metadata", {})),
         )
 
         await self.execute_write(stmt)
@@ -156,9 +195,9 @@ class InterventionPlanQueries(BaseQuery):
         if results:
             plan = results[0]
             # Parse JSON fields
-            plan["objectives"] = json.loads(plan["objectives"])
-            plan["tags"] = json.loads(plan["tags"]) if plan["tags"] else []
-            plan["metadata"] = json.loads(plan["metadata"]) if plan["metadata"] else {}
+            plan["objectives"] = _loads(plan["objectives"])
+            plan["tags"] = _loads(plan["tags"]) if plan["tags"] else []
+            plan["metadata"] = _loads(plan["metadata"]) if plan["metadata"] else {}
             return plan
         return None
 
@@ -183,9 +222,9 @@ class InterventionPlanQueries(BaseQuery):
 
         # Parse JSON fields
         for plan in results:
-            plan["objectives"] = json.loads(plan["objectives"])
-            plan["tags"] = json.loads(plan["tags"]) if plan["tags"] else []
-            plan["metadata"] = json.loads(plan["metadata"]) if plan["metadata"] else {}
+            plan["objectives"] = _loads(plan["objectives"])
+            plan["tags"] = _loads(plan["tags"]) if plan["tags"] else []
+            plan["metadata"] = _loads(plan["metadata"]) if plan["metadata"] else {}
 
         return results
 
@@ -250,7 +289,7 @@ class PhaseQueries(BaseQuery):
             description=description,
             sequence_order=sequence_order,
             is_parallel=kwargs.get("is_parallel", False),
-            dependencies=json.dumps(kwargs.get("dependencies", [])),
+            dependencies=_dumps(kwargs.get("dependencies", [])),
             status=kwargs.get("status", "pending"),
             estimated_minutes=kwargs.get("estimated_minutes"),
             blocking_reason=kwargs.get("blocking_reason"),
@@ -277,7 +316,7 @@ class PhaseQueries(BaseQuery):
         if results:
             phase = results[0]
             # Parse JSON fields
-            phase["dependencies"] = json.loads(phase["dependencies"]) if phase["dependencies"] else []
+            phase["dependencies"] = _loads(phase["dependencies"]) if phase["dependencies"] else []
             return phase
         return None
 
@@ -301,7 +340,7 @@ class PhaseQueries(BaseQuery):
 
         # Parse JSON fields
         for phase in results:
-            phase["dependencies"] = json.loads(phase["dependencies"]) if phase["dependencies"] else []
+            phase["dependencies"] = _loads(phase["dependencies"]) if phase["dependencies"] else []
 
         return results
 
@@ -372,8 +411,8 @@ class MicroTaskQueries(BaseQuery):
             task_type=kwargs.get("task_type", "coding"),
             status="pending",
             priority=kwargs.get("priority", 5),
-            input_files=json.dumps(kwargs.get("input_files", [])),
-            output_files=json.dumps(kwargs.get("output_files", [])),
+            input_files=_dumps(kwargs.get("input_files", [])),
+            output_files=_dumps(kwargs.get("output_files", [])),
         )
 
         await self.execute_write(stmt)
@@ -410,8 +449,8 @@ class MicroTaskQueries(BaseQuery):
 
         # Parse JSON fields
         for task in results:
-            task["input_files"] = json.loads(task["input_files"]) if task["input_files"] else []
-            task["output_files"] = json.loads(task["output_files"]) if task["output_files"] else []
+            task["input_files"] = _loads(task["input_files"]) if task["input_files"] else []
+            task["output_files"] = _loads(task["output_files"]) if task["output_files"] else []
 
         return results
 
@@ -503,8 +542,8 @@ class MicroTaskQueries(BaseQuery):
 
         # Parse JSON fields
         for task in results:
-            task["input_files"] = json.loads(task["input_files"]) if task["input_files"] else []
-            task["output_files"] = json.loads(task["output_files"]) if task["output_files"] else []
+            task["input_files"] = _loads(task["input_files"]) if task["input_files"] else []
+            task["output_files"] = _loads(task["output_files"]) if task["output_files"] else []
 
         return results
 
@@ -540,9 +579,9 @@ class SemanticMemoryQueries(BaseQuery):
             content=content,
             content_type=content_type,
             content_format=kwargs.get("content_format", "text"),
-            embedding=json.dumps(embedding) if embedding else None,
-            keywords=json.dumps(keywords) if keywords else None,
-            entities=json.dumps(kwargs.get("entities", [])),
+            embedding=_dumps(embedding) if embedding else None,
+            keywords=_dumps(keywords) if keywords else None,
+            entities=_dumps(kwargs.get("entities", [])),
             plan_id=kwargs.get("plan_id"),
             phase_id=kwargs.get("phase_id"),
             task_id=kwargs.get("task_id"),
@@ -588,9 +627,9 @@ class SemanticMemoryQueries(BaseQuery):
 
         # Parse JSON fields
         for memory in results:
-            memory["keywords"] = json.loads(memory["keywords"]) if memory["keywords"] else []
-            memory["entities"] = json.loads(memory["entities"]) if memory["entities"] else []
-            memory["embedding"] = json.loads(memory["embedding"]) if memory["embedding"] else None
+            memory["keywords"] = _loads(memory["keywords"]) if memory["keywords"] else []
+            memory["entities"] = _loads(memory["entities"]) if memory["entities"] else []
+            memory["embedding"] = _loads(memory["embedding"]) if memory["embedding"] else None
 
         return results
 
@@ -610,9 +649,9 @@ class SemanticMemoryQueries(BaseQuery):
         if results:
             memory = results[0]
             # Parse JSON fields
-            memory["keywords"] = json.loads(memory["keywords"]) if memory["keywords"] else []
-            memory["entities"] = json.loads(memory["entities"]) if memory["entities"] else []
-            memory["embedding"] = json.loads(memory["embedding"]) if memory["embedding"] else None
+            memory["keywords"] = _loads(memory["keywords"]) if memory["keywords"] else []
+            memory["entities"] = _loads(memory["entities"]) if memory["entities"] else []
+            memory["embedding"] = _loads(memory["embedding"]) if memory["embedding"] else None
             return memory
         return None
 
@@ -670,8 +709,8 @@ class WorkSessionQueries(BaseQuery):
             user_id=user_id,
             context_window_size=kwargs.get("context_window_size", 256000),
             status="active",
-            active_tasks=json.dumps([]),
-            completed_tasks=json.dumps([]),
+            active_tasks=_dumps([]),
+            completed_tasks=_dumps([]),
         )
 
         await self.execute_write(stmt)
@@ -691,8 +730,8 @@ class WorkSessionQueries(BaseQuery):
 
         if results:
             session = results[0]
-            session["active_tasks"] = json.loads(session["active_tasks"])
-            session["completed_tasks"] = json.loads(session["completed_tasks"])
+            session["active_tasks"] = _loads(session["active_tasks"])
+            session["completed_tasks"] = _loads(session["completed_tasks"])
             return session
         return None
 
@@ -718,8 +757,8 @@ class WorkSessionQueries(BaseQuery):
             return False
 
         session = results[0]
-        active = json.loads(session["active_tasks"])
-        completed_list = json.loads(session["completed_tasks"])
+        active = _loads(session["active_tasks"])
+        completed_list = _loads(session["completed_tasks"])
 
         if completed:
             if task_id in active:
@@ -734,8 +773,8 @@ class WorkSessionQueries(BaseQuery):
             update(work_sessions)
             .where(work_sessions.c.id == session_id)
             .values(
-                active_tasks=json.dumps(active),
-                completed_tasks=json.dumps(completed_list),
+                active_tasks=_dumps(active),
+                completed_tasks=_dumps(completed_list),
                 last_activity_at=datetime.utcnow(),
             )
         )
@@ -0,0 +1,17 @@
+"""
+Hook integration test configuration.
+
+Hook scripts import their siblings as top-level modules (e.g. ``mcp_client``,
+``pre_tool_use``), so their directories are put on sys.path once here instead
+of inside each test.
+"""
+
+import sys
+from pathlib import Path
+
+HOOKS_BASE = Path(__file__).parent.parent.parent.parent / '.claude/hooks/devstream'
+
+for _hook_dir in ('utils', 'memory', 'context'):
+    _path = str(HOOKS_BASE / _hook_dir)
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
@@ -10,11 +10,6 @@ import pytest
 import asyncio
 from pathlib import Path
 from unittest.mock import Mock, patch
-import sys
-
-# Add hooks to path
-HOOKS_BASE = Path(__file__).parent.parent.parent.parent / '.claude/hooks/devstream'
-sys.path.insert(0, str(HOOKS_BASE / 'utils'))
 
 from mcp_client import get_mcp_client
 
@@ -28,7 +23,6 @@ async def test_pretooluse_hook_context_injection():
     test_content = "import numpy as np\n"
 
     # Import hook
-    sys.path.insert(0, str(HOOKS_BASE / 'memory'))
     from pre_tool_use import PreToolUseHook
 
     hook = PreToolUseHook()
@@ -57,7 +51,6 @@ async def test_posttooluse_hook_memory_storage():
     test_file = "test_module.py"
 
     # Import hook
-    sys.path.insert(0, str(HOOKS_BASE / 'memory'))
     from post_tool_use import PostToolUseHook
 
     hook = PostToolUseHook()
@@ -78,7 +71,6 @@ async def test_user_prompt_submit_enhancement():
     user_query = "how to implement async testing with pytest"
 
     # Import hook
-    sys.path.insert(0, str(HOOKS_BASE / 'context'))
     from user_query_context_enhancer import UserPromptSubmitHook
 
     hook = UserPromptSubmitHook()
@@ -113,7 +105,6 @@ async def test_mcp_server_connectivity():
 async def test_hook_graceful_fallback():
     """Test hooks handle errors gracefully without blocking."""
     # Arrange
-    sys.path.insert(0, str(HOOKS_BASE / 'memory'))
     from pre_tool_use import PreToolUseHook
 
     hook = PreToolUseHook()
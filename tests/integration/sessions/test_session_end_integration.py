@@ -8,6 +8,7 @@ Validates triple-source architecture and Context7 compliance.
 
 import pytest
 import asyncio
+import os
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -329,4 +330,6 @@ def test_summary_validation():
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
\ No newline at end of file
+    # Quiet, cache-free runs by default; set VERBOSE=1 for per-test output
+    verbosity = ["-v"] if os.getenv("VERBOSE") else ["-q", "-p", "no:cacheprovider"]
+    pytest.main([__file__, "--tb=short", *verbosity])
\ No newline at end of file
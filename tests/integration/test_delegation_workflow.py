@@ -20,12 +20,18 @@ from unittest.mock import AsyncMock, MagicMock, patch, call
 import sys
 import os
 
-# Add agents module to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root / ".claude" / "hooks"))
+# Add agents module to path (no-op when the root conftest already did)
+_HOOKS_DIR = str(Path(__file__).parent.parent.parent / ".claude" / "hooks")
+if _HOOKS_DIR not in sys.path:
+    sys.path.insert(0, _HOOKS_DIR)
 
 from devstream.agents.pattern_matcher import PatternMatcher
-from devstream.agents.agent_router import AgentRouter, TaskAssessment
+from devstream.agents.agent_router import (
+    AgentRouter,
+    ArchitecturalImpact,
+    Complexity,
+    TaskAssessment,
+)
 from devstream.agents.pattern_catalog import PatternMatch
 
 
@@ -42,8 +48,7 @@ class TestPythonFileDelegation:
         """Provide AgentRouter instance."""
         return AgentRouter()
 
-    @pytest.mark.asyncio
-    async def test_python_file_auto_delegation(self, matcher, router):
+    def test_python_file_auto_delegation(self, matcher, router):
         """Test auto-delegation for simple Python file edit."""
         # Step 1: Pattern matching
         pattern_match = matcher.match_patterns(
@@ -64,13 +69,13 @@ class TestPythonFileDelegation:
             "affected_files": ["api.py"]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
 
-        assert assessment.complexity == "LOW"
-        assert assessment.architectural_impact == "LOW"
+        assert assessment.complexity == Complexity.LOW
+        assert assessment.architectural_impact == ArchitecturalImpact.LOW
         assert assessment.recommendation == "DELEGATE"
 
         # Step 3: Auto-approval decision
@@ -82,8 +87,7 @@ class TestPythonFileDelegation:
         assert "DELEGATE with @python-specialist" in message
         assert "Auto-delegation approved" in message
 
-    @pytest.mark.asyncio
-    async def test_python_file_high_complexity_escalation(self, matcher, router):
+    def test_python_file_high_complexity_escalation(self, matcher, router):
         """Test escalation for high complexity Python task."""
         # Pattern matching
         pattern_match = matcher.match_patterns(
@@ -100,12 +104,12 @@ class TestPythonFileDelegation:
             "affected_files": [f"file_{i}.py" for i in range(10)]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
 
-        assert assessment.complexity == "HIGH"
+        assert assessment.complexity == Complexity.HIGH
         assert assessment.recommendation == "ESCALATE"
         assert router.should_auto_approve(assessment) is False
 
@@ -128,8 +132,7 @@ class TestTypeScriptFileDelegation:
         """Provide AgentRouter instance."""
         return AgentRouter()
 
-    @pytest.mark.asyncio
-    async def test_typescript_file_auto_delegation(self, matcher, router):
+    def test_typescript_file_auto_delegation(self, matcher, router):
         """Test auto-delegation for TypeScript React component."""
         # Pattern matching
         pattern_match = matcher.match_patterns(
@@ -149,16 +152,15 @@ class TestTypeScriptFileDelegation:
             "affected_files": ["Component.tsx"]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
 
-        assert assessment.complexity == "LOW"
+        assert assessment.complexity == Complexity.LOW
         assert router.should_auto_approve(assessment) is True
 
-    @pytest.mark.asyncio
-    async def test_typescript_new_api_coordination(self, matcher, router):
+    def test_typescript_new_api_coordination(self, matcher, router):
         """Test coordination for new API endpoint (medium impact)."""
         pattern_match = matcher.match_patterns(
             file_path="api.ts",
@@ -173,12 +175,12 @@ class TestTypeScriptFileDelegation:
             "affected_files": ["api.ts"]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
 
-        assert assessment.architectural_impact == "MEDIUM"
+        assert assessment.architectural_impact == ArchitecturalImpact.MEDIUM
         assert assessment.recommendation == "COORDINATE"
         assert router.should_auto_approve(assessment) is False
 
@@ -196,8 +198,7 @@ class TestRustAndGoFileDelegation:
         """Provide AgentRouter instance."""
         return AgentRouter()
 
-    @pytest.mark.asyncio
-    async def test_rust_file_delegation(self, matcher, router):
+    def test_rust_file_delegation(self, matcher, router):
         """Test delegation for Rust file."""
         pattern_match = matcher.match_patterns(
             file_path="main.rs",
@@ -215,7 +216,7 @@ class TestRustAndGoFileDelegation:
             "affected_files": ["main.rs"]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
@@ -223,8 +224,7 @@ class TestRustAndGoFileDelegation:
         assert assessment.suggested_agent == "@rust-specialist"
         assert router.should_auto_approve(assessment) is True
 
-    @pytest.mark.asyncio
-    async def test_go_file_delegation(self, matcher, router):
+    def test_go_file_delegation(self, matcher, router):
         """Test delegation for Go file."""
         pattern_match = matcher.match_patterns(
             file_path="server.go",
@@ -242,7 +242,7 @@ class TestRustAndGoFileDelegation:
             "affected_files": ["server.go"]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
@@ -263,8 +263,7 @@ class TestQualityGateEnforcement:
         """Provide AgentRouter instance."""
         return AgentRouter()
 
-    @pytest.mark.asyncio
-    async def test_git_commit_quality_gate(self, matcher, router):
+    def test_git_commit_quality_gate(self, matcher, router):
         """Test git commit triggers mandatory code review."""
         # Quality gate pattern matching
         pattern_match = matcher.match_patterns(
@@ -286,7 +285,7 @@ class TestQualityGateEnforcement:
             "affected_files": ["api.py"]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
@@ -298,8 +297,7 @@ class TestQualityGateEnforcement:
         should_approve = router.should_auto_approve(assessment)
         assert should_approve is True
 
-    @pytest.mark.asyncio
-    async def test_merge_quality_gate(self, matcher, router):
+    def test_merge_quality_gate(self, matcher, router):
         """Test merge triggers mandatory review."""
         pattern_match = matcher.match_patterns(
             tool_name="merge branch",
@@ -310,8 +308,7 @@ class TestQualityGateEnforcement:
         assert pattern_match["agent"] == "@code-reviewer"
         assert "Pre-merge" in pattern_match["reason"]
 
-    @pytest.mark.asyncio
-    async def test_quality_gate_priority_over_file_type(self, matcher, router):
+    def test_quality_gate_priority_over_file_type(self, matcher, router):
         """Test quality gate has priority over file type detection."""
         # Even though api.py would match @python-specialist,
         # git commit should match @code-reviewer with higher priority
@@ -325,52 +322,58 @@ class TestQualityGateEnforcement:
         assert pattern_match["confidence"] == 1.0
 
 
+@pytest.fixture
+def mock_mcp_client(monkeypatch):
+    """Provide an AsyncMock MCP client returned by the hook's get_mcp_client."""
+    mock_mcp = AsyncMock()
+    mock_mcp.call_tool = AsyncMock(return_value={
+        "success": True,
+        "memory_id": "test-123"
+    })
+    monkeypatch.setattr(
+        "devstream.memory.pre_tool_use.get_mcp_client", lambda: mock_mcp
+    )
+    return mock_mcp
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio(loop_scope="session")
 class TestMemoryLoggingIntegration:
     """Test memory logging integration in delegation workflow."""
 
-    @pytest.mark.asyncio
-    async def test_delegation_decision_logged_to_memory(self):
+    async def test_delegation_decision_logged_to_memory(self, mock_mcp_client):
         """Test delegation decision is logged to DevStream memory."""
         from devstream.memory.pre_tool_use import PreToolUseHook
 
-        # Mock MCP client
-        mock_mcp = AsyncMock()
-        mock_mcp.call_tool = AsyncMock(return_value={
-            "success": True,
-            "memory_id": "test-123"
-        })
-
-        with patch('devstream.memory.pre_tool_use.get_mcp_client', return_value=mock_mcp):
-            hook = PreToolUseHook()
+        hook = PreToolUseHook()
 
-            # Simulate delegation check
-            assessment = await hook.check_agent_delegation(
-                file_path="api.py",
-                content="from fastapi import FastAPI",
-                tool_name="Edit",
-                user_query="fix bug"
-            )
+        # Simulate delegation check
+        assessment = await hook.check_agent_delegation(
+            file_path="api.py",
+            content="from fastapi import FastAPI",
+            tool_name="Edit",
+            user_query="fix bug"
+        )
 
-            if assessment:
-                # Verify memory logging was attempted
-                # (actual logging happens in _log_delegation_decision)
-                assert assessment.suggested_agent is not None
-                assert assessment.confidence > 0
-                assert assessment.recommendation in ["DELEGATE", "COORDINATE", "ESCALATE"]
+        if assessment:
+            # Verify memory logging was attempted
+            # (actual logging happens in _log_delegation_decision)
+            assert assessment.suggested_agent is not None
+            assert assessment.confidence > 0
+            assert assessment.recommendation in ["DELEGATE", "COORDINATE", "ESCALATE"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mock_mcp_client")
     async def test_memory_logging_disabled_via_config(self):
         """Test memory logging can be disabled via config."""
         with patch.dict(os.environ, {"DEVSTREAM_MEMORY_ENABLED": "false"}):
             from devstream.memory.pre_tool_use import PreToolUseHook
 
-            mock_mcp = AsyncMock()
             hook = PreToolUseHook()
 
             # Mock assessment
             mock_assessment = TaskAssessment(
-                complexity="LOW",
-                architectural_impact="NONE",
+                complexity=Complexity.LOW,
+                architectural_impact=ArchitecturalImpact.NONE,
                 recommendation="DELEGATE",
                 suggested_agent="@python-specialist",
                 confidence=0.95,
@@ -393,10 +396,11 @@ class TestMemoryLoggingIntegration:
                     assert not hook.mcp_client.call_tool.called
 
 
+@pytest.mark.slow
+@pytest.mark.asyncio(loop_scope="session")
 class TestConfigurationFlags:
     """Test configuration flag behavior."""
 
-    @pytest.mark.asyncio
     async def test_delegation_disabled_via_config(self):
         """Test delegation can be disabled via config flag."""
         with patch.dict(os.environ, {"DEVSTREAM_AGENT_AUTO_DELEGATION_ENABLED": "false"}):
@@ -413,7 +417,6 @@ class TestConfigurationFlags:
 
             assert assessment is None
 
-    @pytest.mark.asyncio
     async def test_delegation_enabled_by_default(self):
         """Test delegation is enabled by default."""
         with patch.dict(os.environ, {}, clear=True):
@@ -422,10 +425,11 @@ class TestConfigurationFlags:
             assert enabled is True
 
 
+@pytest.mark.slow
+@pytest.mark.asyncio(loop_scope="session")
 class TestGracefulDegradation:
     """Test graceful degradation when components unavailable."""
 
-    @pytest.mark.asyncio
     async def test_missing_pattern_matcher_graceful(self):
         """Test graceful degradation when PatternMatcher unavailable."""
         from devstream.memory.pre_tool_use import PreToolUseHook
@@ -444,7 +448,6 @@ class TestGracefulDegradation:
 
         assert assessment is None
 
-    @pytest.mark.asyncio
     async def test_pattern_match_failure_graceful(self):
         """Test graceful handling of pattern match failure."""
         from devstream.memory.pre_tool_use import PreToolUseHook
@@ -477,8 +480,7 @@ class TestMultiFileScenarios:
         """Provide AgentRouter instance."""
         return AgentRouter()
 
-    @pytest.mark.asyncio
-    async def test_multi_file_medium_complexity(self, matcher, router):
+    def test_multi_file_medium_complexity(self, matcher, router):
         """Test medium complexity assessment for multi-file edit."""
         pattern_match = matcher.match_patterns(file_path="api.py")
 
@@ -490,16 +492,15 @@ class TestMultiFileScenarios:
             "affected_files": ["api.py", "models.py", "schemas.py"]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
 
-        assert assessment.complexity == "MEDIUM"
+        assert assessment.complexity == Complexity.MEDIUM
         assert assessment.recommendation == "COORDINATE"
 
-    @pytest.mark.asyncio
-    async def test_many_files_high_complexity(self, matcher, router):
+    def test_many_files_high_complexity(self, matcher, router):
         """Test high complexity assessment for many files."""
         pattern_match = matcher.match_patterns(file_path="api.py")
 
@@ -511,20 +512,19 @@ class TestMultiFileScenarios:
             "affected_files": [f"module_{i}.py" for i in range(10)]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
 
-        assert assessment.complexity == "HIGH"
+        assert assessment.complexity == Complexity.HIGH
         assert assessment.recommendation == "ESCALATE"
 
 
 class TestEndToEndWorkflow:
     """Test complete end-to-end delegation workflow."""
 
-    @pytest.mark.asyncio
-    async def test_complete_delegation_workflow_success(self):
+    def test_complete_delegation_workflow_success(self):
         """Test complete workflow from pattern match to decision."""
         # Step 1: Initialize components
         matcher = PatternMatcher()
@@ -548,7 +548,7 @@ class TestEndToEndWorkflow:
             "affected_files": ["api.py"]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
@@ -565,8 +565,7 @@ class TestEndToEndWorkflow:
         assert "DELEGATE" in message
         assert "@python-specialist" in message
 
-    @pytest.mark.asyncio
-    async def test_complete_workflow_escalation_path(self):
+    def test_complete_workflow_escalation_path(self):
         """Test complete workflow ending in escalation."""
         matcher = PatternMatcher()
         router = AgentRouter()
@@ -585,7 +584,7 @@ class TestEndToEndWorkflow:
             "affected_files": ["api.py", "auth.py", "models.py", "middleware.py"]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
@@ -594,7 +593,7 @@ class TestEndToEndWorkflow:
         message = router.format_advisory_message(assessment)
 
         # Should escalate
-        assert assessment.architectural_impact == "HIGH"
+        assert assessment.architectural_impact == ArchitecturalImpact.HIGH
         assert should_approve is False
         assert "ESCALATE" in message
         assert "Full @tech-lead analysis required" in message
@@ -603,8 +602,7 @@ class TestEndToEndWorkflow:
 class TestPerformanceIntegration:
     """Test performance of integrated delegation workflow."""
 
-    @pytest.mark.asyncio
-    async def test_end_to_end_workflow_performance(self):
+    def test_end_to_end_workflow_performance(self):
         """Test complete workflow completes within performance target."""
         import time
 
@@ -627,7 +625,7 @@ class TestPerformanceIntegration:
             "affected_files": ["api.py"]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
@@ -6,11 +6,16 @@ Validates end-to-end functionality, robustness, and performance.
 """
 
 import asyncio
+import copy
 import json
 import logging
 import os
+import re
 import pytest
+import pytest_asyncio
+import time
 from datetime import datetime
+from statistics import fmean
 from typing import Dict, Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -22,62 +27,88 @@ from devstream.memory.search import HybridSearchEngine
 
 logger = logging.getLogger(__name__)
 
+# Share one event loop across the module; asyncio_mode=auto marks the tests
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+_AUTH_RE = re.compile(r"auth", re.IGNORECASE)
+
+# Mock Ollama responses, serialized once at import instead of per fixture call;
+# the client mock hands out deep copies so callers cannot mutate the templates
+_MOCK_CHAT_RESPONSE = {
+    "message": {
+        "content": json.dumps({
+            "tasks": [
+                {
+                    "title": "Design user interface",
+                    "description": "Create wireframes and mockups for the user interface",
+                    "estimated_minutes": 8,
+                    "complexity_score": 5,
+                    "priority_score": 7,
+                    "task_type": "design",
+                    "reasoning": "UI design is crucial for user experience"
+                },
+                {
+                    "title": "Implement authentication backend",
+                    "description": "Set up JWT-based authentication system",
+                    "estimated_minutes": 10,
+                    "complexity_score": 7,
+                    "priority_score": 9,
+                    "task_type": "implementation",
+                    "reasoning": "Security is a high priority requirement"
+                },
+                {
+                    "title": "Create user registration form",
+                    "description": "Build frontend form for user registration",
+                    "estimated_minutes": 6,
+                    "complexity_score": 4,
+                    "priority_score": 8,
+                    "task_type": "implementation",
+                    "reasoning": "Registration is needed for user onboarding"
+                }
+            ],
+            "planning_confidence": 0.85,
+            "total_estimated_minutes": 24
+        })
+    }
+}
+
+_MOCK_EMBEDDING = {
+    "embedding": [0.1] * 384  # Mock embedding vector
+}
+
+_EDGE_CASES = [
+    {
+        "name": "unicode_objective",
+        "objective": "Créer une application avec émojis 🚀🌟",
+        "context": "Unicode handling test"
+    },
+    {
+        "name": "very_long_objective",
+        "objective": "Create a comprehensive enterprise-grade distributed microservices architecture with real-time data processing, machine learning capabilities, advanced security features, multi-tenant support, and scalable deployment infrastructure" * 3,
+        "context": "Long text handling"
+    },
+    {
+        "name": "special_characters",
+        "objective": "Fix issue with @#$%^&*()_+ characters in user input",
+        "context": "Special character handling"
+    }
+]
+
 
 class TestAIPlanningIntegration:
     """Integration tests for AI Planning system."""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def ollama_client(self):
         """Create mock Ollama client."""
         client = AsyncMock(spec=OllamaClient)
 
-        # Mock successful chat response
-        client.chat.return_value = {
-            "message": {
-                "content": json.dumps({
-                    "tasks": [
-                        {
-                            "title": "Design user interface",
-                            "description": "Create wireframes and mockups for the user interface",
-                            "estimated_minutes": 8,
-                            "complexity_score": 5,
-                            "priority_score": 7,
-                            "task_type": "design",
-                            "reasoning": "UI design is crucial for user experience"
-                        },
-                        {
-                            "title": "Implement authentication backend",
-                            "description": "Set up JWT-based authentication system",
-                            "estimated_minutes": 10,
-                            "complexity_score": 7,
-                            "priority_score": 9,
-                            "task_type": "implementation",
-                            "reasoning": "Security is a high priority requirement"
-                        },
-                        {
-                            "title": "Create user registration form",
-                            "description": "Build frontend form for user registration",
-                            "estimated_minutes": 6,
-                            "complexity_score": 4,
-                            "priority_score": 8,
-                            "task_type": "implementation",
-                            "reasoning": "Registration is needed for user onboarding"
-                        }
-                    ],
-                    "planning_confidence": 0.85,
-                    "total_estimated_minutes": 24
-                })
-            }
-        }
-
-        # Mock embedding response
-        client.embedding.return_value = {
-            "embedding": [0.1] * 384  # Mock embedding vector
-        }
+        client.chat.side_effect = lambda *args, **kwargs: copy.deepcopy(_MOCK_CHAT_RESPONSE)
+        client.embedding.side_effect = lambda *args, **kwargs: copy.deepcopy(_MOCK_EMBEDDING)
 
         return client
 
-    @pytest.fixture
+    @pytest_asyncio.fixture(scope="session", loop_scope="session")
     async def memory_search(self):
         """Create mock memory search engine."""
         search = AsyncMock(spec=HybridSearchEngine)
@@ -100,7 +131,7 @@ class TestAIPlanningIntegration:
 
         return search
 
-    @pytest.fixture
+    @pytest_asyncio.fixture(scope="session", loop_scope="session")
     async def planner_config(self):
         """Create test planner configuration."""
         return AIPlannerConfig(
@@ -110,7 +141,7 @@ class TestAIPlanningIntegration:
             timeout_seconds=30
         )
 
-    @pytest.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def ai_planner(self, ollama_client, memory_search, planner_config):
         """Create AI planner instance for testing."""
         return OllamaPlanner(
@@ -119,12 +150,11 @@ class TestAIPlanningIntegration:
             config=planner_config
         )
 
-    @pytest.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def test_framework(self, ai_planner):
         """Create test framework instance."""
         return AITestFramework(ai_planner)
 
-    @pytest.mark.asyncio
     async def test_comprehensive_test_suite(self, test_framework):
         """Run the complete comprehensive test suite."""
         logger.info("Starting comprehensive AI planning test suite")
@@ -153,7 +183,6 @@ class TestAIPlanningIntegration:
 
         return report
 
-    @pytest.mark.asyncio
     async def test_basic_task_breakdown(self, ai_planner):
         """Test basic task breakdown functionality."""
         request = TaskBreakdownRequest(
@@ -176,7 +205,6 @@ class TestAIPlanningIntegration:
             assert 1 <= task.estimated_minutes <= 60, "Invalid estimated minutes"
             assert 1 <= task.complexity_score <= 10, "Invalid complexity score"
 
-    @pytest.mark.asyncio
     async def test_dependency_analysis(self, ai_planner):
         """Test dependency analysis functionality."""
         request = TaskBreakdownRequest(
@@ -193,7 +221,6 @@ class TestAIPlanningIntegration:
             # Not strictly required but expected for complex tasks
             assert isinstance(result.dependencies, list), "Dependencies should be a list"
 
-    @pytest.mark.asyncio
     async def test_complexity_estimation(self, ai_planner):
         """Test complexity estimation accuracy."""
         # Simple task
@@ -219,13 +246,12 @@ class TestAIPlanningIntegration:
         complex_complexities = [task.complexity_score for task in complex_result.suggested_tasks]
 
         # Simple tasks should generally have lower complexity
-        avg_simple = sum(simple_complexities) / len(simple_complexities)
-        avg_complex = sum(complex_complexities) / len(complex_complexities)
+        avg_simple = fmean(simple_complexities)
+        avg_complex = fmean(complex_complexities)
 
         # Allow some flexibility but expect general trend
         assert avg_simple <= avg_complex + 2, "Complexity estimation seems inverted"
 
-    @pytest.mark.asyncio
     async def test_validation_error_handling(self, ai_planner):
         """Test validation and error handling."""
         # Test empty objective
@@ -237,7 +263,6 @@ class TestAIPlanningIntegration:
             )
             await ai_planner.break_down_task(request)
 
-    @pytest.mark.asyncio
     async def test_memory_context_integration(self, ai_planner):
         """Test memory context integration."""
         request = TaskBreakdownRequest(
@@ -254,15 +279,14 @@ class TestAIPlanningIntegration:
 
         # Tasks should reference authentication concepts
         auth_related = any(
-            "auth" in task.title.lower() or "auth" in task.description.lower()
+            _AUTH_RE.search(task.title) or _AUTH_RE.search(task.description)
             for task in result.suggested_tasks
         )
         assert auth_related, "No authentication-related tasks generated"
 
-    @pytest.mark.asyncio
     async def test_performance_benchmarks(self, ai_planner):
         """Test performance benchmarks."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         request = TaskBreakdownRequest(
             objective="Optimize database query performance",
@@ -273,13 +297,12 @@ class TestAIPlanningIntegration:
 
         result = await ai_planner.break_down_task(request)
 
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
 
         # Performance requirements
         assert execution_time < 10.0, f"Planning took {execution_time:.2f}s, should be < 10s"
         assert len(result.suggested_tasks) > 0, "No tasks generated in performance test"
 
-    @pytest.mark.asyncio
     async def test_concurrent_planning_requests(self, ai_planner):
         """Test handling of concurrent planning requests."""
         requests = [
@@ -303,7 +326,6 @@ class TestAIPlanningIntegration:
             assert not isinstance(result, Exception), f"Concurrent request {i} failed: {result}"
             assert len(result.suggested_tasks) > 0, f"No tasks in concurrent result {i}"
 
-    @pytest.mark.asyncio
     async def test_fallback_mechanisms(self, ai_planner):
         """Test fallback mechanisms when AI fails."""
         # Mock AI failure
@@ -333,40 +355,22 @@ class TestAIPlanningIntegration:
         assert "complex_system_design" in scenario_names
         assert "vague_objective" in scenario_names
 
-    @pytest.mark.asyncio
-    async def test_edge_cases(self, ai_planner):
-        """Test various edge cases."""
-        edge_cases = [
-            {
-                "name": "unicode_objective",
-                "objective": "Créer une application avec émojis 🚀🌟",
-                "context": "Unicode handling test"
-            },
-            {
-                "name": "very_long_objective",
-                "objective": "Create a comprehensive enterprise-grade distributed microservices architecture with real-time data processing, machine learning capabilities, advanced security features, multi-tenant support, and scalable deployment infrastructure" * 3,
-                "context": "Long text handling"
-            },
-            {
-                "name": "special_characters",
-                "objective": "Fix issue with @#$%^&*()_+ characters in user input",
-                "context": "Special character handling"
-            }
-        ]
+    @pytest.mark.parametrize("case", _EDGE_CASES, ids=[c["name"] for c in _EDGE_CASES])
+    async def test_edge_case(self, ai_planner, case):
+        """Test edge case handling for a single scenario."""
+        request = TaskBreakdownRequest(
+            objective=case["objective"],
+            context=case["context"],
+            max_tasks=4,
+            context_source=f"edge_case_{case['name']}"
+        )
 
-        for case in edge_cases:
-            request = TaskBreakdownRequest(
-                objective=case["objective"],
-                context=case["context"],
-                max_tasks=4,
-                context_source=f"edge_case_{case['name']}"
-            )
+        try:
+            result = await ai_planner.break_down_task(request)
+        except Exception as e:
+            pytest.fail(f"Edge case {case['name']} failed: {e}")
 
-            try:
-                result = await ai_planner.break_down_task(request)
-                assert len(result.suggested_tasks) > 0, f"Edge case {case['name']} generated no tasks"
-            except Exception as e:
-                pytest.fail(f"Edge case {case['name']} failed: {e}")
+        assert len(result.suggested_tasks) > 0, f"Edge case {case['name']} generated no tasks"
 
 
 # Standalone test runner for manual execution
@@ -403,8 +407,14 @@ async def run_comprehensive_tests():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_file = f"ai_planning_test_report_{timestamp}.json"
 
-    with open(report_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    try:
+        import orjson
+
+        with open(report_file, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    except ImportError:
+        with open(report_file, 'w') as f:
+            json.dump(report, f, indent=2)
 
     print(f"Comprehensive test report saved to: {report_file}")
     print(f"Test Summary: {report['summary']['passed_tests']}/{report['summary']['total_tests']} passed")
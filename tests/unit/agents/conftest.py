@@ -9,7 +9,21 @@ import sys
 from pathlib import Path
 
 # Add .claude/hooks to sys.path for importing devstream modules
-project_root = Path(__file__).parent.parent.parent.parent
-hooks_dir = project_root / ".claude" / "hooks"
-if str(hooks_dir) not in sys.path:
-    sys.path.insert(0, str(hooks_dir))
+# (no-op when the root conftest has already inserted it)
+_HOOKS_DIR = str(Path(__file__).parents[3] / ".claude" / "hooks")
+if _HOOKS_DIR not in sys.path:
+    sys.path.insert(0, _HOOKS_DIR)
+
+
+@pytest.fixture(scope="session")
+def pattern_matcher():
+    """Provide a shared PatternMatcher (catalog patterns are static)."""
+    from devstream.agents.pattern_matcher import PatternMatcher
+    return PatternMatcher()
+
+
+@pytest.fixture(scope="session")
+def agent_router():
+    """Provide a shared AgentRouter (assessments are pure, so it holds no per-test state)."""
+    from devstream.agents.agent_router import AgentRouter
+    return AgentRouter()
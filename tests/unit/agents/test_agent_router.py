@@ -13,17 +13,17 @@ Test categories:
 - Edge cases and error handling
 """
 
+import dataclasses
 import pytest
-import pytest_asyncio
-from pathlib import Path
-import sys
-from typing import Dict, Any
 
-# Add agents module to path
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root / ".claude" / "hooks"))
-
-from devstream.agents.agent_router import AgentRouter, TaskAssessment
+# devstream.agents is importable via the .claude/hooks path set up in conftest.py
+from devstream.agents.agent_router import (
+    AgentRouter,
+    ArchitecturalImpact,
+    AssessmentContext,
+    Complexity,
+    TaskAssessment,
+)
 from devstream.agents.pattern_catalog import PatternMatch
 
 
@@ -36,8 +36,8 @@ class TestAgentRouterInit:
 
         # Verify thresholds set correctly
         assert router.AUTO_APPROVE_CONFIDENCE_THRESHOLD == 0.95
-        assert router.AUTO_APPROVE_MAX_COMPLEXITY == "LOW"
-        assert router.AUTO_APPROVE_MAX_IMPACT == "LOW"
+        assert router.AUTO_APPROVE_MAX_COMPLEXITY == Complexity.LOW
+        assert router.AUTO_APPROVE_MAX_IMPACT == ArchitecturalImpact.LOW
 
     def test_configurable_thresholds(self):
         """Test that thresholds are configurable."""
@@ -48,321 +48,234 @@ class TestAgentRouterInit:
         assert hasattr(router, 'AUTO_APPROVE_MAX_COMPLEXITY')
         assert hasattr(router, 'AUTO_APPROVE_MAX_IMPACT')
 
-
-class TestComplexityAssessment:
-    """Test task complexity assessment logic."""
-
-    @pytest.fixture
-    def router(self):
-        """Provide AgentRouter instance."""
-        return AgentRouter()
-
-    def test_low_complexity_single_file(self, router):
-        """Test LOW complexity for single file."""
-        complexity = router._assess_complexity_signals(
-            pattern_match={"agent": "@python-specialist", "confidence": 0.95},
-            user_query="fix bug in function",
-            file_path="test.py",
-            affected_files=["test.py"]
-        )
-
-        assert complexity == "LOW"
-
-    def test_medium_complexity_multiple_files(self, router):
-        """Test MEDIUM complexity for multiple files (2-5)."""
-        complexity = router._assess_complexity_signals(
-            pattern_match={"agent": "@python-specialist", "confidence": 0.95},
-            user_query="update API endpoints",
-            file_path="api.py",
-            affected_files=["api.py", "models.py", "schemas.py"]
-        )
-
-        assert complexity == "MEDIUM"
-
-    def test_high_complexity_many_files(self, router):
-        """Test HIGH complexity for many files (>5)."""
-        affected_files = [f"file_{i}.py" for i in range(10)]
-        complexity = router._assess_complexity_signals(
-            pattern_match={"agent": "@python-specialist", "confidence": 0.95},
-            user_query="update all modules",
-            file_path="api.py",
-            affected_files=affected_files
+    def test_threshold_override_applies_everywhere(self):
+        """Test that overriding a threshold affects approval and recommendation alike."""
+        router = AgentRouter()
+        router.AUTO_APPROVE_MAX_IMPACT = ArchitecturalImpact.NONE
+        pattern_match = PatternMatch(
+            agent="@python-specialist",
+            confidence=0.95,
+            reason="File extension '.py' matched @python-specialist",
+            method="extension"
         )
 
-        assert complexity == "HIGH"
-
-    def test_high_complexity_refactor_keyword(self, router):
-        """Test HIGH complexity for refactoring keywords."""
-        complexity = router._assess_complexity_signals(
-            pattern_match={"agent": "@python-specialist", "confidence": 0.95},
-            user_query="refactor entire architecture",
-            file_path="api.py",
-            affected_files=["api.py"]
+        assessment = router.assess_task_complexity(
+            pattern_match,
+            {"file_path": "src/api/users.py", "user_query": "fix validation bug", "affected_files": ["src/api/users.py"]}
         )
 
-        assert complexity == "HIGH"
-
-    def test_high_complexity_migrate_keyword(self, router):
-        """Test HIGH complexity for migration keywords."""
-        complexity = router._assess_complexity_signals(
-            pattern_match={"agent": "@python-specialist", "confidence": 0.95},
-            user_query="migrate to new database",
-            file_path="api.py",
-            affected_files=["api.py"]
-        )
+        assert assessment.architectural_impact == ArchitecturalImpact.LOW
+        assert assessment.recommendation == "COORDINATE"
+        assert not router.should_auto_approve(assessment)
 
-        assert complexity == "HIGH"
 
-    def test_medium_complexity_integrate_keyword(self, router):
-        """Test MEDIUM complexity for integration keywords."""
-        complexity = router._assess_complexity_signals(
-            pattern_match={"agent": "@python-specialist", "confidence": 0.95},
-            user_query="integrate third-party API",
-            file_path="api.py",
-            affected_files=["api.py"]
-        )
-
-        assert complexity == "MEDIUM"
+class TestComplexityAssessment:
+    """Test task complexity assessment logic."""
 
-    def test_low_complexity_default(self, router):
-        """Test LOW complexity as default."""
-        complexity = router._assess_complexity_signals(
+    @pytest.mark.parametrize(
+        "user_query,file_count,expected",
+        [
+            pytest.param("fix bug in function", 1, Complexity.LOW, id="low-single-file"),
+            pytest.param("update API endpoints", 3, Complexity.MEDIUM, id="medium-multiple-files"),
+            pytest.param("update all modules", 10, Complexity.HIGH, id="high-many-files"),
+            pytest.param("refactor entire architecture", 1, Complexity.HIGH, id="high-refactor-keyword"),
+            pytest.param("migrate to new database", 1, Complexity.HIGH, id="high-migrate-keyword"),
+            pytest.param("integrate third-party API", 1, Complexity.MEDIUM, id="medium-integrate-keyword"),
+            pytest.param("add new function", 1, Complexity.LOW, id="low-default"),
+        ]
+    )
+    def test_complexity(self, agent_router, user_query, file_count, expected):
+        """Test complexity from file count and query keywords."""
+        complexity = agent_router._assess_complexity_signals(
             pattern_match={"agent": "@python-specialist", "confidence": 0.95},
-            user_query="add new function",
-            file_path="utils.py",
-            affected_files=["utils.py"]
+            query_lower=user_query.lower(),
+            file_count=file_count
         )
 
-        assert complexity == "LOW"
+        assert complexity == expected
 
 
 class TestArchitecturalImpactAssessment:
     """Test architectural impact assessment logic."""
 
-    @pytest.fixture
-    def router(self):
-        """Provide AgentRouter instance."""
-        return AgentRouter()
-
-    def test_high_impact_migration(self, router):
-        """Test HIGH impact for database migration."""
-        impact = router._assess_architectural_impact(
-            user_query="database migration from MySQL to PostgreSQL",
-            file_path="migration.py",
-            tool_name=None
-        )
-
-        assert impact == "HIGH"
-
-    def test_high_impact_breaking_change(self, router):
-        """Test HIGH impact for breaking changes."""
-        impact = router._assess_architectural_impact(
-            user_query="implement breaking change to API",
-            file_path="api.py",
-            tool_name=None
-        )
-
-        assert impact == "HIGH"
-
-    def test_high_impact_new_service(self, router):
-        """Test HIGH impact for new service."""
-        impact = router._assess_architectural_impact(
-            user_query="create new authentication service",
-            file_path="auth.py",
-            tool_name=None
-        )
-
-        assert impact == "HIGH"
-
-    def test_medium_impact_new_api(self, router):
-        """Test MEDIUM impact for new API."""
-        impact = router._assess_architectural_impact(
-            user_query="add new API endpoint",
-            file_path="api.py",
-            tool_name=None
-        )
-
-        assert impact == "MEDIUM"
-
-    def test_medium_impact_integration(self, router):
-        """Test MEDIUM impact for third-party integration."""
-        impact = router._assess_architectural_impact(
-            user_query="integrate Stripe payment gateway",
-            file_path="payments.py",
-            tool_name=None
-        )
-
-        assert impact == "MEDIUM"
-
-    def test_low_impact_fix(self, router):
-        """Test LOW impact for bug fix."""
-        impact = router._assess_architectural_impact(
-            user_query="fix validation bug",
-            file_path="validators.py",
-            tool_name=None
-        )
-
-        assert impact == "LOW"
-
-    def test_low_impact_optimize(self, router):
-        """Test LOW impact for optimization."""
-        impact = router._assess_architectural_impact(
-            user_query="optimize query performance",
-            file_path="queries.py",
-            tool_name=None
-        )
-
-        assert impact == "LOW"
-
-    def test_none_impact_default(self, router):
-        """Test NONE impact as default."""
-        impact = router._assess_architectural_impact(
-            user_query="add logging",
-            file_path="logger.py",
+    @pytest.mark.parametrize(
+        "user_query,file_path,expected",
+        [
+            pytest.param(
+                "database migration from MySQL to PostgreSQL", "migration.py",
+                ArchitecturalImpact.HIGH, id="high-migration"
+            ),
+            pytest.param(
+                "implement breaking change to API", "api.py",
+                ArchitecturalImpact.HIGH, id="high-breaking-change"
+            ),
+            pytest.param(
+                "create new authentication service", "auth.py",
+                ArchitecturalImpact.HIGH, id="high-new-service"
+            ),
+            pytest.param(
+                "add new API endpoint", "api.py",
+                ArchitecturalImpact.MEDIUM, id="medium-new-api"
+            ),
+            pytest.param(
+                "integrate Stripe payment gateway", "payments.py",
+                ArchitecturalImpact.MEDIUM, id="medium-integration"
+            ),
+            pytest.param(
+                "fix validation bug", "validators.py",
+                ArchitecturalImpact.LOW, id="low-fix"
+            ),
+            pytest.param(
+                "optimize query performance", "queries.py",
+                ArchitecturalImpact.LOW, id="low-optimize"
+            ),
+            pytest.param(
+                "add logging", "logger.py",
+                ArchitecturalImpact.NONE, id="none-default"
+            ),
+        ]
+    )
+    def test_impact(self, agent_router, user_query, file_path, expected):
+        """Test architectural impact from query keywords."""
+        impact = agent_router._assess_architectural_impact(
+            query_lower=user_query.lower(),
+            file_path=file_path,
             tool_name=None
         )
 
-        assert impact == "NONE"
+        assert impact == expected
 
 
 class TestRecommendationLogic:
     """Test delegation recommendation logic."""
 
-    @pytest.fixture
-    def router(self):
-        """Provide AgentRouter instance."""
-        return AgentRouter()
-
-    def test_delegate_recommendation(self, router):
+    def test_delegate_recommendation(self, agent_router):
         """Test DELEGATE recommendation for high confidence + low complexity/impact."""
-        recommendation = router._determine_recommendation(
+        recommendation = agent_router._determine_recommendation(
             confidence=0.95,
-            complexity="LOW",
-            architectural_impact="LOW"
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.LOW
         )
 
         assert recommendation == "DELEGATE"
 
-    def test_delegate_none_impact(self, router):
+    def test_delegate_none_impact(self, agent_router):
         """Test DELEGATE recommendation with NONE impact."""
-        recommendation = router._determine_recommendation(
+        recommendation = agent_router._determine_recommendation(
             confidence=0.95,
-            complexity="LOW",
-            architectural_impact="NONE"
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.NONE
         )
 
         assert recommendation == "DELEGATE"
 
-    def test_coordinate_medium_complexity(self, router):
+    def test_coordinate_medium_complexity(self, agent_router):
         """Test COORDINATE recommendation for medium complexity."""
-        recommendation = router._determine_recommendation(
+        recommendation = agent_router._determine_recommendation(
             confidence=0.90,
-            complexity="MEDIUM",
-            architectural_impact="LOW"
+            complexity=Complexity.MEDIUM,
+            architectural_impact=ArchitecturalImpact.LOW
         )
 
         assert recommendation == "COORDINATE"
 
-    def test_coordinate_medium_impact(self, router):
+    def test_coordinate_medium_impact(self, agent_router):
         """Test COORDINATE recommendation for medium impact."""
-        recommendation = router._determine_recommendation(
+        recommendation = agent_router._determine_recommendation(
             confidence=0.90,
-            complexity="LOW",
-            architectural_impact="MEDIUM"
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.MEDIUM
         )
 
         assert recommendation == "COORDINATE"
 
-    def test_escalate_high_complexity(self, router):
+    def test_escalate_high_complexity(self, agent_router):
         """Test ESCALATE recommendation for high complexity."""
-        recommendation = router._determine_recommendation(
+        recommendation = agent_router._determine_recommendation(
             confidence=0.95,
-            complexity="HIGH",
-            architectural_impact="LOW"
+            complexity=Complexity.HIGH,
+            architectural_impact=ArchitecturalImpact.LOW
         )
 
         assert recommendation == "ESCALATE"
 
-    def test_escalate_high_impact(self, router):
+    def test_escalate_high_impact(self, agent_router):
         """Test ESCALATE recommendation for high impact."""
-        recommendation = router._determine_recommendation(
+        recommendation = agent_router._determine_recommendation(
             confidence=0.95,
-            complexity="LOW",
-            architectural_impact="HIGH"
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.HIGH
         )
 
         assert recommendation == "ESCALATE"
 
-    def test_escalate_low_confidence(self, router):
+    def test_escalate_low_confidence(self, agent_router):
         """Test ESCALATE recommendation for low confidence (<0.85)."""
-        recommendation = router._determine_recommendation(
+        recommendation = agent_router._determine_recommendation(
             confidence=0.80,
-            complexity="LOW",
-            architectural_impact="LOW"
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.LOW
         )
 
         assert recommendation == "ESCALATE"
 
-    def test_boundary_confidence_0_85(self, router):
+    def test_boundary_confidence_0_85(self, agent_router):
         """Test boundary case: confidence exactly 0.85."""
-        recommendation = router._determine_recommendation(
+        recommendation = agent_router._determine_recommendation(
             confidence=0.85,
-            complexity="LOW",
-            architectural_impact="LOW"
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.LOW
         )
 
         # 0.85 should COORDINATE (not high enough for DELEGATE)
         assert recommendation == "COORDINATE"
 
 
-@pytest_asyncio.fixture
-async def sample_pattern_match() -> PatternMatch:
+SAMPLE_PATTERN_MATCH = PatternMatch(
+    agent="@python-specialist",
+    confidence=0.95,
+    reason="File extension '.py' matched @python-specialist",
+    method="extension"
+)
+
+SAMPLE_CONTEXT = AssessmentContext(
+    file_path="api.py",
+    user_query="fix bug",
+    tool_name="Edit",
+    affected_files=("api.py",)
+)
+
+
+@pytest.fixture
+def sample_pattern_match() -> PatternMatch:
     """Provide sample pattern match for testing."""
-    return PatternMatch(
-        agent="@python-specialist",
-        confidence=0.95,
-        reason="File extension '.py' matched @python-specialist",
-        method="extension"
-    )
+    return SAMPLE_PATTERN_MATCH
 
 
-@pytest_asyncio.fixture
-async def sample_context() -> Dict[str, Any]:
+@pytest.fixture
+def sample_context() -> AssessmentContext:
     """Provide sample context for testing."""
-    return {
-        "file_path": "api.py",
-        "content": "from fastapi import FastAPI",
-        "user_query": "fix bug",
-        "tool_name": "Edit",
-        "affected_files": ["api.py"]
-    }
+    return SAMPLE_CONTEXT
 
 
 class TestTaskAssessment:
     """Test full task assessment workflow."""
 
-    @pytest.fixture
-    def router(self):
-        """Provide AgentRouter instance."""
-        return AgentRouter()
-
-    @pytest.mark.asyncio
-    async def test_assess_low_complexity_task(self, router, sample_pattern_match, sample_context):
+    def test_assess_low_complexity_task(self, agent_router, sample_pattern_match, sample_context):
         """Test assessment of low complexity task."""
-        assessment = await router.assess_task_complexity(
+        assessment = agent_router.assess_task_complexity(
             pattern_match=sample_pattern_match,
             context=sample_context
         )
 
-        assert assessment.complexity == "LOW"
-        assert assessment.architectural_impact in ["NONE", "LOW"]
+        assert assessment.complexity == Complexity.LOW
+        assert assessment.architectural_impact in [ArchitecturalImpact.NONE, ArchitecturalImpact.LOW]
         assert assessment.recommendation in ["DELEGATE", "COORDINATE"]
         assert assessment.suggested_agent == "@python-specialist"
         assert assessment.confidence == 0.95
         assert len(assessment.reason) > 0
 
-    @pytest.mark.asyncio
-    async def test_assess_high_complexity_task(self, router, sample_pattern_match):
+    def test_assess_high_complexity_task(self, agent_router, sample_pattern_match):
         """Test assessment of high complexity task."""
         context = {
             "file_path": "api.py",
@@ -372,16 +285,15 @@ class TestTaskAssessment:
             "affected_files": ["api.py", "models.py", "schemas.py", "db.py", "utils.py", "config.py"]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = agent_router.assess_task_complexity(
             pattern_match=sample_pattern_match,
             context=context
         )
 
-        assert assessment.complexity == "HIGH"
+        assert assessment.complexity == Complexity.HIGH
         assert assessment.recommendation == "ESCALATE"
 
-    @pytest.mark.asyncio
-    async def test_assess_high_impact_task(self, router, sample_pattern_match):
+    def test_assess_high_impact_task(self, agent_router, sample_pattern_match):
         """Test assessment of high architectural impact task."""
         context = {
             "file_path": "auth.py",
@@ -391,172 +303,221 @@ class TestTaskAssessment:
             "affected_files": ["auth.py"]
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = agent_router.assess_task_complexity(
             pattern_match=sample_pattern_match,
             context=context
         )
 
-        assert assessment.architectural_impact == "HIGH"
+        assert assessment.architectural_impact == ArchitecturalImpact.HIGH
         assert assessment.recommendation == "ESCALATE"
 
-    @pytest.mark.asyncio
-    async def test_assess_task_invalid_pattern_match(self, router, sample_context):
+    def test_assess_task_invalid_pattern_match(self, agent_router, sample_context):
         """Test that invalid pattern_match raises ValueError."""
         with pytest.raises(ValueError, match="pattern_match cannot be None"):
-            await router.assess_task_complexity(
+            agent_router.assess_task_complexity(
                 pattern_match=None,
                 context=sample_context
             )
 
-    @pytest.mark.asyncio
-    async def test_assess_task_empty_context(self, router, sample_pattern_match):
+    def test_assess_task_empty_context(self, agent_router, sample_pattern_match):
         """Test assessment with minimal context."""
         context = {}
 
-        assessment = await router.assess_task_complexity(
+        assessment = agent_router.assess_task_complexity(
             pattern_match=sample_pattern_match,
             context=context
         )
 
         # Should handle gracefully with defaults
-        assert assessment.complexity == "LOW"  # Default
-        assert assessment.architectural_impact == "NONE"  # Default
+        assert assessment.complexity == Complexity.LOW  # Default
+        assert assessment.architectural_impact == ArchitecturalImpact.NONE  # Default
         assert assessment.recommendation == "DELEGATE"
 
+    def test_assess_task_accepts_context_dict(self, agent_router, sample_pattern_match, sample_context):
+        """Test a plain context dict is assessed like the equivalent AssessmentContext."""
+        assessment = agent_router.assess_task_complexity(
+            pattern_match=sample_pattern_match,
+            context={
+                "file_path": "api.py",
+                "content": "from fastapi import FastAPI",
+                "user_query": "fix bug",
+                "tool_name": "Edit",
+                "affected_files": ["api.py"]
+            }
+        )
+
+        assert assessment == agent_router.assess_task_complexity(
+            pattern_match=sample_pattern_match,
+            context=sample_context
+        )
+
+    def test_assessment_is_immutable(self):
+        """Test TaskAssessment is frozen so assessments cannot be mutated."""
+        assessment = TaskAssessment(
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.NONE,
+            recommendation="DELEGATE",
+            suggested_agent="@python-specialist",
+            confidence=0.95,
+            reason="High confidence match"
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            assessment.confidence = 0.5
+
+    def test_levels_compare_equal_to_names(self):
+        """Test levels still compare equal to the former string values."""
+        assert Complexity.LOW == "LOW"
+        assert Complexity.HIGH != "LOW"
+        assert ArchitecturalImpact.NONE == "NONE"
+        assert Complexity.MEDIUM in ("MEDIUM", "HIGH")
+        assert {"LOW": "ok"}[Complexity.LOW] == "ok"
+
+        # Ordering and integer values are unchanged
+        assert Complexity.LOW < Complexity.MEDIUM
+        assert int(ArchitecturalImpact.HIGH) == 3
+
+    @pytest.mark.parametrize("key", [1, "LOW"])
+    def test_level_hash_consistent_with_equality(self, key):
+        """Test levels behave the same as dict keys and set members as under ==."""
+        level = Complexity.LOW
+
+        assert (level == key) is (key in {level})
+        assert (level == key) is (level in {key})
+        assert (level == key) is (key in {level: "ok"})
+        assert (level == key) is (level in {key: "ok"})
+
+    def test_levels_not_equal_to_ints(self):
+        """Test levels only equal their name, so int and string keys never collide."""
+        assert Complexity.LOW != 1
+        assert Complexity.LOW not in {1}
+        assert Complexity.LOW in {"LOW"}
+        assert Complexity.LOW != ArchitecturalImpact.LOW
+
 
 class TestAutoApprovalLogic:
     """Test auto-approval decision logic."""
 
-    @pytest.fixture
-    def router(self):
-        """Provide AgentRouter instance."""
-        return AgentRouter()
-
-    def test_auto_approve_success(self, router):
+    def test_auto_approve_success(self, agent_router):
         """Test auto-approval for qualifying task."""
         assessment = TaskAssessment(
-            complexity="LOW",
-            architectural_impact="NONE",
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.NONE,
             recommendation="DELEGATE",
             suggested_agent="@python-specialist",
             confidence=0.95,
             reason="High confidence match"
         )
 
-        assert router.should_auto_approve(assessment) is True
+        assert agent_router.should_auto_approve(assessment) is True
 
-    def test_auto_approve_low_impact(self, router):
+    def test_auto_approve_low_impact(self, agent_router):
         """Test auto-approval with LOW impact."""
         assessment = TaskAssessment(
-            complexity="LOW",
-            architectural_impact="LOW",
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.LOW,
             recommendation="DELEGATE",
             suggested_agent="@python-specialist",
             confidence=0.95,
             reason="High confidence match"
         )
 
-        assert router.should_auto_approve(assessment) is True
+        assert agent_router.should_auto_approve(assessment) is True
 
-    def test_reject_medium_complexity(self, router):
+    def test_reject_medium_complexity(self, agent_router):
         """Test rejection for medium complexity."""
         assessment = TaskAssessment(
-            complexity="MEDIUM",
-            architectural_impact="NONE",
+            complexity=Complexity.MEDIUM,
+            architectural_impact=ArchitecturalImpact.NONE,
             recommendation="COORDINATE",
             suggested_agent="@python-specialist",
             confidence=0.95,
             reason="Medium complexity"
         )
 
-        assert router.should_auto_approve(assessment) is False
+        assert agent_router.should_auto_approve(assessment) is False
 
-    def test_reject_high_complexity(self, router):
+    def test_reject_high_complexity(self, agent_router):
         """Test rejection for high complexity."""
         assessment = TaskAssessment(
-            complexity="HIGH",
-            architectural_impact="NONE",
+            complexity=Complexity.HIGH,
+            architectural_impact=ArchitecturalImpact.NONE,
             recommendation="ESCALATE",
             suggested_agent="@python-specialist",
             confidence=0.95,
             reason="High complexity"
         )
 
-        assert router.should_auto_approve(assessment) is False
+        assert agent_router.should_auto_approve(assessment) is False
 
-    def test_reject_medium_impact(self, router):
+    def test_reject_medium_impact(self, agent_router):
         """Test rejection for medium impact."""
         assessment = TaskAssessment(
-            complexity="LOW",
-            architectural_impact="MEDIUM",
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.MEDIUM,
             recommendation="COORDINATE",
             suggested_agent="@python-specialist",
             confidence=0.95,
             reason="Medium impact"
         )
 
-        assert router.should_auto_approve(assessment) is False
+        assert agent_router.should_auto_approve(assessment) is False
 
-    def test_reject_high_impact(self, router):
+    def test_reject_high_impact(self, agent_router):
         """Test rejection for high impact."""
         assessment = TaskAssessment(
-            complexity="LOW",
-            architectural_impact="HIGH",
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.HIGH,
             recommendation="ESCALATE",
             suggested_agent="@python-specialist",
             confidence=0.95,
             reason="High impact"
         )
 
-        assert router.should_auto_approve(assessment) is False
+        assert agent_router.should_auto_approve(assessment) is False
 
-    def test_reject_low_confidence(self, router):
+    def test_reject_low_confidence(self, agent_router):
         """Test rejection for low confidence (<0.95)."""
         assessment = TaskAssessment(
-            complexity="LOW",
-            architectural_impact="NONE",
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.NONE,
             recommendation="COORDINATE",
             suggested_agent="@python-specialist",
             confidence=0.90,
             reason="Medium confidence"
         )
 
-        assert router.should_auto_approve(assessment) is False
+        assert agent_router.should_auto_approve(assessment) is False
 
-    def test_boundary_confidence_0_95(self, router):
+    def test_boundary_confidence_0_95(self, agent_router):
         """Test boundary case: confidence exactly 0.95."""
         assessment = TaskAssessment(
-            complexity="LOW",
-            architectural_impact="NONE",
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.NONE,
             recommendation="DELEGATE",
             suggested_agent="@python-specialist",
             confidence=0.95,
             reason="Exact threshold"
         )
 
-        assert router.should_auto_approve(assessment) is True
+        assert agent_router.should_auto_approve(assessment) is True
 
 
 class TestAdvisoryMessageFormatting:
     """Test advisory message generation."""
 
-    @pytest.fixture
-    def router(self):
-        """Provide AgentRouter instance."""
-        return AgentRouter()
-
-    def test_format_delegate_message(self, router):
+    def test_format_delegate_message(self, agent_router):
         """Test DELEGATE advisory message formatting."""
         assessment = TaskAssessment(
-            complexity="LOW",
-            architectural_impact="NONE",
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.NONE,
             recommendation="DELEGATE",
             suggested_agent="@python-specialist",
             confidence=0.95,
             reason="High confidence Python file match"
         )
 
-        message = router.format_advisory_message(assessment)
+        message = agent_router.format_advisory_message(assessment)
 
         assert "ADVISORY: DELEGATE with @python-specialist" in message
         assert "Confidence: 0.95" in message
@@ -565,36 +526,36 @@ class TestAdvisoryMessageFormatting:
         assert "Auto-delegation approved" in message
         assert assessment.reason in message
 
-    def test_format_coordinate_message(self, router):
+    def test_format_coordinate_message(self, agent_router):
         """Test COORDINATE advisory message formatting."""
         assessment = TaskAssessment(
-            complexity="MEDIUM",
-            architectural_impact="LOW",
+            complexity=Complexity.MEDIUM,
+            architectural_impact=ArchitecturalImpact.LOW,
             recommendation="COORDINATE",
             suggested_agent="@typescript-specialist",
             confidence=0.90,
             reason="Medium complexity TypeScript task"
         )
 
-        message = router.format_advisory_message(assessment)
+        message = agent_router.format_advisory_message(assessment)
 
         assert "ADVISORY: COORDINATE with @typescript-specialist" in message
         assert "Confidence: 0.90" in message
         assert "Complexity: MEDIUM" in message
         assert "Coordination recommended" in message
 
-    def test_format_escalate_message(self, router):
+    def test_format_escalate_message(self, agent_router):
         """Test ESCALATE advisory message formatting."""
         assessment = TaskAssessment(
-            complexity="HIGH",
-            architectural_impact="HIGH",
+            complexity=Complexity.HIGH,
+            architectural_impact=ArchitecturalImpact.HIGH,
             recommendation="ESCALATE",
             suggested_agent="@tech-lead",
             confidence=0.85,
             reason="High complexity architectural change"
         )
 
-        message = router.format_advisory_message(assessment)
+        message = agent_router.format_advisory_message(assessment)
 
         assert "ADVISORY: ESCALATE" in message
         assert "Confidence: 0.85" in message
@@ -602,18 +563,18 @@ class TestAdvisoryMessageFormatting:
         assert "Architectural Impact: HIGH" in message
         assert "Full @tech-lead analysis required" in message
 
-    def test_message_structure(self, router):
+    def test_message_structure(self, agent_router):
         """Test advisory message has proper structure."""
         assessment = TaskAssessment(
-            complexity="LOW",
-            architectural_impact="NONE",
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.NONE,
             recommendation="DELEGATE",
             suggested_agent="@python-specialist",
             confidence=0.95,
             reason="Test reason"
         )
 
-        message = router.format_advisory_message(assessment)
+        message = agent_router.format_advisory_message(assessment)
 
         # Verify structure
         assert message.startswith("ADVISORY:")
@@ -626,12 +587,7 @@ class TestAdvisoryMessageFormatting:
 class TestReasonBuilding:
     """Test assessment reason building."""
 
-    @pytest.fixture
-    def router(self):
-        """Provide AgentRouter instance."""
-        return AgentRouter()
-
-    def test_reason_includes_all_components(self, router):
+    def test_reason_includes_all_components(self, agent_router):
         """Test reason includes pattern match, complexity, and impact."""
         pattern_match = PatternMatch(
             agent="@python-specialist",
@@ -640,10 +596,10 @@ class TestReasonBuilding:
             method="extension"
         )
 
-        reason = router._build_assessment_reason(
+        reason = agent_router._build_assessment_reason(
             pattern_match=pattern_match,
-            complexity="LOW",
-            architectural_impact="NONE",
+            complexity=Complexity.LOW,
+            architectural_impact=ArchitecturalImpact.NONE,
             recommendation="DELEGATE"
         )
 
@@ -654,7 +610,7 @@ class TestReasonBuilding:
         assert "no architectural impact" in reason
         assert "Auto-delegation criteria met" in reason
 
-    def test_reason_coordinate_context(self, router):
+    def test_reason_coordinate_context(self, agent_router):
         """Test reason includes coordination context."""
         pattern_match = PatternMatch(
             agent="@typescript-specialist",
@@ -663,10 +619,10 @@ class TestReasonBuilding:
             method="import"
         )
 
-        reason = router._build_assessment_reason(
+        reason = agent_router._build_assessment_reason(
             pattern_match=pattern_match,
-            complexity="MEDIUM",
-            architectural_impact="LOW",
+            complexity=Complexity.MEDIUM,
+            architectural_impact=ArchitecturalImpact.LOW,
             recommendation="COORDINATE"
         )
 
@@ -674,7 +630,7 @@ class TestReasonBuilding:
         assert "multi-file or moderate scope" in reason
         assert "Coordination recommended" in reason
 
-    def test_reason_escalate_context(self, router):
+    def test_reason_escalate_context(self, agent_router):
         """Test reason includes escalation context."""
         pattern_match = PatternMatch(
             agent="@tech-lead",
@@ -683,10 +639,10 @@ class TestReasonBuilding:
             method="keyword"
         )
 
-        reason = router._build_assessment_reason(
+        reason = agent_router._build_assessment_reason(
             pattern_match=pattern_match,
-            complexity="HIGH",
-            architectural_impact="HIGH",
+            complexity=Complexity.HIGH,
+            architectural_impact=ArchitecturalImpact.HIGH,
             recommendation="ESCALATE"
         )
 
@@ -699,13 +655,7 @@ class TestReasonBuilding:
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    @pytest.fixture
-    def router(self):
-        """Provide AgentRouter instance."""
-        return AgentRouter()
-
-    @pytest.mark.asyncio
-    async def test_missing_optional_fields(self, router):
+    def test_missing_optional_fields(self, agent_router):
         """Test assessment with missing optional context fields."""
         pattern_match = PatternMatch(
             agent="@python-specialist",
@@ -720,17 +670,16 @@ class TestEdgeCases:
             "affected_files": []
         }
 
-        assessment = await router.assess_task_complexity(
+        assessment = agent_router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
 
         # Should handle gracefully
-        assert assessment.complexity == "LOW"
-        assert assessment.architectural_impact == "NONE"
+        assert assessment.complexity == Complexity.LOW
+        assert assessment.architectural_impact == ArchitecturalImpact.NONE
 
-    @pytest.mark.asyncio
-    async def test_extreme_confidence_values(self, router):
+    def test_extreme_confidence_values(self, agent_router):
         """Test assessment with extreme confidence values."""
         pattern_match = PatternMatch(
             agent="@python-specialist",
@@ -741,26 +690,36 @@ class TestEdgeCases:
 
         context = {"file_path": "test.py"}
 
-        assessment = await router.assess_task_complexity(
+        assessment = agent_router.assess_task_complexity(
             pattern_match=pattern_match,
             context=context
         )
 
         assert assessment.confidence == 1.0
-        assert router.should_auto_approve(assessment) is True
+        assert agent_router.should_auto_approve(assessment) is True
 
-    def test_case_insensitive_keyword_matching(self, router):
+    def test_case_insensitive_keyword_matching(self, agent_router, sample_pattern_match):
         """Test keyword matching is case-insensitive."""
-        impact1 = router._assess_architectural_impact(
-            user_query="MIGRATION DATABASE",
-            file_path="migrate.py",
-            tool_name=None
+        assessment1 = agent_router.assess_task_complexity(
+            pattern_match=sample_pattern_match,
+            context=AssessmentContext(file_path="migrate.py", user_query="MIGRATION DATABASE")
+        )
+
+        assessment2 = agent_router.assess_task_complexity(
+            pattern_match=sample_pattern_match,
+            context=AssessmentContext(file_path="migrate.py", user_query="migration database")
         )
 
-        impact2 = router._assess_architectural_impact(
-            user_query="migration database",
-            file_path="migrate.py",
+        assert assessment1.architectural_impact == ArchitecturalImpact.HIGH
+        assert assessment2.architectural_impact == ArchitecturalImpact.HIGH
+
+    def test_impact_keeps_highest_nested_tier(self, agent_router):
+        """Test keywords nested inside longer keywords are still seen."""
+        # "external service" is MEDIUM, but the nested "service" is HIGH
+        impact = agent_router._assess_architectural_impact(
+            query_lower="call external service",
+            file_path=None,
             tool_name=None
         )
 
-        assert impact1 == impact2 == "HIGH"
+        assert impact == ArchitecturalImpact.HIGH
@@ -0,0 +1,56 @@
+"""
+Latency benchmarks for the AgentRouter hot path.
+
+Guards the per-call cost of task assessment against regressions using
+pytest-benchmark. Each benchmark fails if its mean exceeds the
+documented <5ms assessment target.
+
+Benchmarks are excluded from the default run; run them with:
+    make test-performance
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from devstream.agents.agent_router import AssessmentContext
+from devstream.agents.pattern_catalog import PatternMatch
+
+pytestmark = pytest.mark.benchmark(group="agent-router", max_time=0.5)
+
+# Performance target from the AgentRouter docstring (seconds)
+ASSESSMENT_BUDGET = 0.005
+
+BENCH_PATTERN_MATCH = PatternMatch(
+    agent="@python-specialist",
+    confidence=0.95,
+    reason="File extension '.py' matched @python-specialist",
+    method="extension"
+)
+
+BENCH_CONTEXT = AssessmentContext(
+    file_path="src/api/users.py",
+    user_query="fix validation bug",
+    tool_name="Edit",
+    affected_files=("src/api/users.py",)
+)
+
+
+def test_bench_assess_task_complexity(benchmark, agent_router):
+    """Benchmark task assessment."""
+    assessment = benchmark(
+        agent_router.assess_task_complexity, BENCH_PATTERN_MATCH, BENCH_CONTEXT
+    )
+
+    assert agent_router.should_auto_approve(assessment)
+    assert benchmark.stats.stats.mean < ASSESSMENT_BUDGET
+
+
+def test_bench_format_advisory_message(benchmark, agent_router):
+    """Benchmark advisory message rendering."""
+    assessment = agent_router.assess_task_complexity(BENCH_PATTERN_MATCH, BENCH_CONTEXT)
+
+    message = benchmark(agent_router.format_advisory_message, assessment)
+
+    assert "@python-specialist" in message
+    assert benchmark.stats.stats.mean < ASSESSMENT_BUDGET
@@ -7,15 +7,11 @@ keyword frequency analysis, and quality gate patterns.
 Coverage target: 95%+
 """
 
+import os
 import pytest
-from pathlib import Path
-import sys
 
-# Add agents module to path
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root / ".claude" / "hooks"))
-
-from devstream.agents.pattern_matcher import PatternMatcher
+# devstream.agents is importable via the .claude/hooks path set up in conftest.py
+from devstream.agents.pattern_matcher import PatternMatcher, _file_extension
 from devstream.agents.pattern_catalog import PatternMatch, PATTERN_CATALOG
 
 
@@ -42,126 +38,152 @@ class TestPatternMatcherInit:
 class TestExtensionMatching:
     """Test file extension-based pattern matching."""
 
-    @pytest.fixture
-    def matcher(self):
-        return PatternMatcher()
-
-    def test_python_extension_match(self, matcher):
-        """Test Python file extension matching."""
-        result = matcher.match_patterns(file_path="test.py")
+    @pytest.mark.parametrize(
+        "file_path,agent",
+        [
+            ("test.py", "@python-specialist"),
+            ("component.ts", "@typescript-specialist"),
+            ("main.rs", "@rust-specialist"),
+            ("server.go", "@go-specialist"),
+        ]
+    )
+    def test_extension_match(self, pattern_matcher, file_path, agent):
+        """Test language file extension matching."""
+        result = pattern_matcher.match_patterns(file_path=file_path)
         assert result is not None
-        assert result["agent"] == "@python-specialist"
+        assert result["agent"] == agent
         assert result["confidence"] == 0.95
         assert result["method"] == "extension"
 
-    def test_typescript_extension_match(self, matcher):
-        """Test TypeScript file extension matching."""
-        result = matcher.match_patterns(file_path="component.ts")
-        assert result is not None
-        assert result["agent"] == "@typescript-specialist"
-        assert result["confidence"] == 0.95
+    @pytest.mark.parametrize(
+        "file_path",
+        ["src/api/users.py", "archive.tar.gz", ".bashrc", "dir.v1/Makefile", "a/..py", "////...", ""]
+    )
+    def test_file_extension_matches_splitext(self, file_path):
+        """Test extension slicing agrees with os.path.splitext."""
+        assert _file_extension(file_path) == os.path.splitext(file_path)[1]
 
-    def test_rust_extension_match(self, matcher):
-        """Test Rust file extension matching."""
-        result = matcher.match_patterns(file_path="main.rs")
-        assert result is not None
-        assert result["agent"] == "@rust-specialist"
-        assert result["confidence"] == 0.95
-
-    def test_go_extension_match(self, matcher):
-        """Test Go file extension matching."""
-        result = matcher.match_patterns(file_path="server.go")
-        assert result is not None
-        assert result["agent"] == "@go-specialist"
-        assert result["confidence"] == 0.95
-
-    def test_unknown_extension_no_match(self, matcher):
+    def test_unknown_extension_no_match(self, pattern_matcher):
         """Test unknown extension returns no match."""
-        result = matcher.match_patterns(file_path="file.xyz")
+        result = pattern_matcher.match_patterns(file_path="file.xyz")
         assert result is None
 
+    def test_returned_match_is_copy(self, pattern_matcher):
+        """Test mutating a returned match does not corrupt the prebuilt result."""
+        first = pattern_matcher.match_patterns(file_path="test.py")
+        first["agent"] = "@mutated"
+
+        second = pattern_matcher.match_patterns(file_path="test.py")
+        assert second["agent"] == "@python-specialist"
+
+
+class TestShebangDetection:
+    """Test shebang detection."""
+
+    @pytest.mark.parametrize(
+        "shebang,agent",
+        [
+            ("#!/usr/bin/env python3", "@python-specialist"),
+            ("#!/usr/bin/node", "@typescript-specialist"),
+            ("#!/usr/bin/env go run", "@go-specialist"),
+        ]
+    )
+    def test_shebang_detection(self, pattern_matcher, shebang, agent):
+        """Test shebang on the first line routes to the interpreter's specialist."""
+        result = pattern_matcher.match_patterns(file_path="script", content=f"{shebang}\nbody")
+        assert result is not None
+        assert result["agent"] == agent
+        assert result["method"] == "shebang"
+
 
 class TestImportDetection:
     """Test import statement detection."""
 
-    @pytest.fixture
-    def matcher(self):
-        return PatternMatcher()
-
-    def test_python_fastapi_import(self, matcher):
+    def test_python_fastapi_import(self, pattern_matcher):
         """Test FastAPI import detection routes to @python-specialist."""
         content = "from fastapi import FastAPI"
-        result = matcher.match_patterns(file_path="api.txt", content=content)
+        result = pattern_matcher.match_patterns(file_path="api.txt", content=content)
         assert result is not None
         assert result["agent"] == "@python-specialist"
         assert result["confidence"] == 0.90
         assert result["method"] == "import"
 
-    def test_typescript_react_import(self, matcher):
+    def test_typescript_react_import(self, pattern_matcher):
         """Test React import detection routes to @typescript-specialist."""
         content = "import React from 'react'"
-        result = matcher.match_patterns(file_path="component.txt", content=content)
+        result = pattern_matcher.match_patterns(file_path="component.txt", content=content)
         assert result is not None
         assert result["agent"] == "@typescript-specialist"
         assert result["confidence"] == 0.90
 
-    def test_rust_tokio_import(self, matcher):
+    def test_rust_tokio_import(self, pattern_matcher):
         """Test Rust Tokio import detection."""
         content = "use tokio::net::TcpListener;"
-        result = matcher.match_patterns(file_path="server.txt", content=content)
+        result = pattern_matcher.match_patterns(file_path="server.txt", content=content)
         assert result is not None
         assert result["agent"] == "@rust-specialist"
         assert result["confidence"] == 0.90
 
-    def test_go_github_import(self, matcher):
+    def test_go_github_import(self, pattern_matcher):
         """Test Go GitHub import detection."""
         content = 'import "github.com/gin-gonic/gin"'
-        result = matcher.match_patterns(file_path="server.txt", content=content)
+        result = pattern_matcher.match_patterns(file_path="server.txt", content=content)
         assert result is not None
         assert result["agent"] == "@go-specialist"
         assert result["confidence"] == 0.90
 
-    def test_database_sqlalchemy_import(self, matcher):
+    def test_database_sqlalchemy_import(self, pattern_matcher):
         """Test SQLAlchemy import detection."""
         content = "from sqlalchemy import create_engine"
-        result = matcher.match_patterns(file_path="db.txt", content=content)
+        result = pattern_matcher.match_patterns(file_path="db.txt", content=content)
         assert result is not None
         assert result["agent"] == "@database-specialist"
         assert result["confidence"] == 0.90
 
+    def test_imports_beyond_scan_limit_ignored(self, pattern_matcher):
+        """Test import detection only scans the head of the content."""
+        padding = "#\n" * (PatternMatcher.IMPORT_SCAN_LIMIT // 2)
+        content = padding + "from fastapi import FastAPI"
+        result = pattern_matcher.match_patterns(file_path="late.txt", content=content)
+        assert result is None
+
+    def test_catalog_order_wins_over_content_order(self, pattern_matcher):
+        """Test earlier catalog pattern wins even if its import appears later."""
+        content = "from sqlalchemy import create_engine\nfrom fastapi import FastAPI"
+        result = pattern_matcher.match_patterns(file_path="app.txt", content=content)
+        assert result is not None
+        assert result["agent"] == "@python-specialist"
+        assert result["method"] == "import"
+
 
 class TestQualityGatePatterns:
     """Test quality gate pattern matching."""
 
-    @pytest.fixture
-    def matcher(self):
-        return PatternMatcher()
-
-    def test_git_commit_triggers_review(self, matcher):
+    def test_git_commit_triggers_review(self, pattern_matcher):
         """Test git commit tool triggers @code-reviewer."""
-        result = matcher.match_patterns(tool_name="git commit")
+        result = pattern_matcher.match_patterns(tool_name="git commit")
         assert result is not None
         assert result["agent"] == "@code-reviewer"
         assert result["confidence"] == 1.0
         assert result["method"] == "mandatory"
 
-    def test_git_tool_triggers_review(self, matcher):
+    def test_git_tool_triggers_review(self, pattern_matcher):
         """Test generic git tool triggers @code-reviewer."""
-        result = matcher.match_patterns(tool_name="git")
+        result = pattern_matcher.match_patterns(tool_name="git")
         assert result is not None
         assert result["agent"] == "@code-reviewer"
         assert result["confidence"] == 1.0
 
-    def test_merge_triggers_review(self, matcher):
+    def test_merge_triggers_review(self, pattern_matcher):
         """Test merge tool triggers @code-reviewer."""
-        result = matcher.match_patterns(tool_name="merge branch")
+        result = pattern_matcher.match_patterns(tool_name="merge branch")
         assert result is not None
         assert result["agent"] == "@code-reviewer"
         assert result["confidence"] == 1.0
 
-    def test_quality_gate_priority(self, matcher):
+    def test_quality_gate_priority(self, pattern_matcher):
         """Test quality gate has priority over file extension."""
-        result = matcher.match_patterns(tool_name="git commit", file_path="api.py")
+        result = pattern_matcher.match_patterns(tool_name="git commit", file_path="api.py")
         assert result["agent"] == "@code-reviewer"
         assert result["confidence"] == 1.0
 
@@ -169,34 +191,30 @@ class TestQualityGatePatterns:
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    @pytest.fixture
-    def matcher(self):
-        return PatternMatcher()
-
-    def test_empty_inputs_returns_none(self, matcher):
+    def test_empty_inputs_returns_none(self, pattern_matcher):
         """Test empty inputs return None."""
-        result = matcher.match_patterns()
+        result = pattern_matcher.match_patterns()
         assert result is None
 
-    def test_none_inputs_returns_none(self, matcher):
+    def test_none_inputs_returns_none(self, pattern_matcher):
         """Test None inputs return None."""
-        result = matcher.match_patterns(
+        result = pattern_matcher.match_patterns(
             file_path=None, content=None, user_query=None, tool_name=None
         )
         assert result is None
 
-    def test_whitespace_only_content_returns_none(self, matcher):
+    def test_whitespace_only_content_returns_none(self, pattern_matcher):
         """Test whitespace-only content returns None."""
-        result = matcher.match_patterns(content="   \n\t  ", user_query="   ")
+        result = pattern_matcher.match_patterns(content="   \n\t  ", user_query="   ")
         assert result is None
 
-    def test_malformed_file_path_no_crash(self, matcher):
+    def test_malformed_file_path_no_crash(self, pattern_matcher):
         """Test malformed file path does not crash."""
-        result = matcher.match_patterns(file_path="////...")
+        result = pattern_matcher.match_patterns(file_path="////...")
         assert result is None
 
-    def test_case_insensitive_tool_name(self, matcher):
+    def test_case_insensitive_tool_name(self, pattern_matcher):
         """Test tool name matching is case-insensitive."""
-        result1 = matcher.match_patterns(tool_name="GIT COMMIT")
-        result2 = matcher.match_patterns(tool_name="git commit")
+        result1 = pattern_matcher.match_patterns(tool_name="GIT COMMIT")
+        result2 = pattern_matcher.match_patterns(tool_name="git commit")
         assert result1["agent"] == result2["agent"] == "@code-reviewer"
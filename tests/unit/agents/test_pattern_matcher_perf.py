@@ -0,0 +1,94 @@
+"""
+Latency benchmarks for the PatternMatcher hot path.
+
+Guards the per-call cost of PreToolUse pattern matching against
+regressions using pytest-benchmark (warmup, GC control, perf_counter).
+Each benchmark fails if its mean exceeds the documented <10ms target.
+
+Benchmarks are excluded from the default run; run them with:
+    make test-performance
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark(group="pattern-matcher", max_time=0.5)
+
+# Performance target from the PatternMatcher docstring (seconds)
+MATCH_BUDGET = 0.010
+
+# Realistic ~40KB Python module: imports at the top, code below
+MODULE_CONTENT = (
+    '"""Users API."""\n\n'
+    "from fastapi import APIRouter, Depends, HTTPException\n"
+    "from pydantic import BaseModel\n"
+    "from sqlalchemy.orm import Session\n\n"
+    "router = APIRouter()\n\n"
+) + "".join(
+    f"\n\n@router.get('/users/{{user_id}}/items/{n}')\n"
+    f"def read_item_{n}(user_id: int, db: Session = Depends(get_db)):\n"
+    f"    item = db.query(Item).filter(Item.owner_id == user_id).first()\n"
+    f"    if item is None:\n"
+    f"        raise HTTPException(status_code=404, detail='Item {n} not found')\n"
+    f"    return item\n"
+    for n in range(150)
+)
+
+# Realistic prose with no imports or shebang, so every tier is scanned
+NOTES_CONTENT = (
+    "Meeting notes: reviewed the release checklist, agreed on the rollout\n"
+    "window and assigned follow-ups for the dashboard copy changes.\n"
+) * 100
+
+
+def test_bench_extension_match(benchmark, pattern_matcher):
+    """Benchmark extension routing for an edited source file."""
+    result = benchmark(
+        pattern_matcher.match_patterns,
+        file_path="src/api/users.py",
+        content=MODULE_CONTENT,
+        tool_name="Edit"
+    )
+
+    assert result["method"] == "extension"
+    assert benchmark.stats.stats.mean < MATCH_BUDGET
+
+
+def test_bench_import_detection(benchmark, pattern_matcher):
+    """Benchmark import detection for a file without a known extension."""
+    result = benchmark(
+        pattern_matcher.match_patterns,
+        file_path="scripts/serve",
+        content=MODULE_CONTENT,
+        tool_name="Write"
+    )
+
+    assert result["method"] == "import"
+    assert benchmark.stats.stats.mean < MATCH_BUDGET
+
+
+def test_bench_full_scan(benchmark, pattern_matcher):
+    """Benchmark the slowest path, where every tier scans the content."""
+    result = benchmark(
+        pattern_matcher.match_patterns,
+        file_path="docs/notes.txt",
+        content=NOTES_CONTENT,
+        user_query="tidy up the notes",
+        tool_name="Edit"
+    )
+
+    assert result is None
+    assert benchmark.stats.stats.mean < MATCH_BUDGET
+
+
+def test_bench_quality_gate(benchmark, pattern_matcher):
+    """Benchmark the quality gate early exit."""
+    result = benchmark(
+        pattern_matcher.match_patterns,
+        tool_name="git commit",
+        content=MODULE_CONTENT
+    )
+
+    assert result["agent"] == "@code-reviewer"
+    assert benchmark.stats.stats.mean < MATCH_BUDGET
@@ -11,28 +11,89 @@ Context7-validated patterns for SQLAlchemy 2.0 async testing:
 import pytest
 import pytest_asyncio
 from pathlib import Path
-from sqlalchemy import text
+from sqlalchemy import event, text
 
 from devstream.database.connection import ConnectionPool
 from devstream.core.exceptions import DatabaseError
 
+# Keep this module on one xdist worker under --dist loadgroup so the
+# module-scoped engine_pool is built once rather than once per worker
+pytestmark = pytest.mark.xdist_group("connection")
+
+# Per-connection tuning for file-backed test pools: WAL avoids the
+# rollback-journal fsyncs on every commit and lets readers run alongside writers
+TEST_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "cache_size": -65536,
+    "temp_store": "MEMORY",
+}
+
+# Statements reused across tests and loops, built once so every execution
+# hits SQLAlchemy's compiled-statement cache instead of re-parsing SQL
+SELECT_ONE = text("SELECT 1")
+SELECT_VALUE = text("SELECT :value")
+INSERT_NESTED = text("INSERT INTO nested_test VALUES (:id, :value)")
+LIST_TABLES = text("SELECT name FROM sqlite_master WHERE type = 'table'")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def engine_pool(tmp_path_factory):
+    """Create one connection pool (engines + PRAGMA setup) per module."""
+    db_path = tmp_path_factory.mktemp("connection") / "pool.db"
+    pool = ConnectionPool(
+        db_path=str(db_path),
+        max_connections=3,
+        pragmas=TEST_PRAGMAS
+    )
+    await pool.initialize()
+
+    # Count executed statements for the stats tracking test; the pool itself
+    # only tracks per-transaction stats, so the listener lives here
+    pool.stats["statements_executed"] = 0
+
+    def _count_statement(*args):
+        pool.stats["statements_executed"] += 1
+
+    for engine in {id(e): e for e in (pool.engine, pool.read_engine)}.values():
+        event.listen(engine.sync_engine, "before_cursor_execute", _count_statement)
+
+    yield pool
+    await pool.close()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module", autouse=True)
+async def _warmup(engine_pool: ConnectionPool):
+    """Open both engines and compile the shared statements once per module."""
+    async with engine_pool.read_transaction() as conn:
+        await conn.execute(SELECT_ONE)
+        await conn.execute(SELECT_VALUE, {"value": 0})
+    async with engine_pool.write_transaction() as conn:
+        await conn.execute(SELECT_ONE)
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def pool(engine_pool: ConnectionPool):
+    """Provide the shared pool with fresh stats, dropping tables a test created."""
+    for key in engine_pool.stats:
+        engine_pool.stats[key] = 0
+    yield engine_pool
+
+    # Tests exercise real commits across pooled connections, so isolation is
+    # restored by dropping their tables rather than rolling back a savepoint
+    async with engine_pool.write_transaction() as conn:
+        tables = (await conn.execute(LIST_TABLES)).scalars().all()
+        for table in tables:
+            await conn.execute(text(f'DROP TABLE "{table}"'))
+
 
 @pytest.mark.unit
 @pytest.mark.database
+@pytest.mark.asyncio(loop_scope="module")
 class TestConnectionPool:
     """Test connection pool functionality with Context7-validated patterns."""
 
-    @pytest_asyncio.fixture
-    async def pool(self, temp_db_path: str):
-        """Create connection pool for testing."""
-        pool = ConnectionPool(
-            db_path=temp_db_path,
-            max_connections=3
-        )
-        await pool.initialize()
-        yield pool
-        await pool.close()
-
     async def test_pool_initialization(self, pool: ConnectionPool):
         """Test pool initializes correctly with Context7-validated patterns."""
         assert pool.engine is not None
@@ -40,10 +101,19 @@ class TestConnectionPool:
         assert pool.stats["connections_created"] == 0
         assert isinstance(pool.db_path, Path)
 
+    async def test_pragmas_applied(self, pool: ConnectionPool):
+        """Test configured PRAGMAs are applied to pooled connections."""
+        async with pool.read_transaction() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            busy_timeout = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+
+        assert journal_mode == "wal"
+        assert busy_timeout == 5000
+
     async def test_read_transaction_context(self, pool: ConnectionPool):
         """Test read transaction context manager pattern (Context7-validated)."""
         async with pool.read_transaction() as conn:
-            result = await conn.execute(text("SELECT 1"))
+            result = await conn.execute(SELECT_ONE)
             row = result.fetchone()
             assert row[0] == 1
 
@@ -111,7 +181,7 @@ class TestConnectionPool:
 
         # Execute some operations
         async with pool.read_transaction() as conn:
-            await conn.execute(text("SELECT 1"))
+            await conn.execute(SELECT_ONE)
         async with pool.write_transaction() as conn:
             await conn.execute(text("CREATE TABLE stats_test (id INTEGER)"))
 
@@ -124,7 +194,7 @@ class TestConnectionPool:
         # Perform multiple operations to test connection reuse
         for i in range(5):
             async with pool.read_transaction() as conn:
-                result = await conn.execute(text(f"SELECT {i}"))
+                result = await conn.execute(SELECT_VALUE, {"value": i})
                 row = result.fetchone()
                 assert row[0] == i
 
@@ -140,8 +210,10 @@ class TestConnectionPool:
             # Start nested transaction (savepoint)
             savepoint = await conn.begin_nested()
             try:
-                await conn.execute(text("INSERT INTO nested_test VALUES (1, 'good')"))
-                await conn.execute(text("INSERT INTO nested_test VALUES (2, 'bad')"))
+                await conn.execute(INSERT_NESTED, [
+                    {"id": 1, "value": "good"},
+                    {"id": 2, "value": "bad"},
+                ])
 
                 # Simulate error and rollback savepoint
                 await savepoint.rollback()
@@ -150,7 +222,7 @@ class TestConnectionPool:
                 raise
 
             # Insert valid data after savepoint rollback
-            await conn.execute(text("INSERT INTO nested_test VALUES (3, 'final')"))
+            await conn.execute(INSERT_NESTED, {"id": 3, "value": "final"})
 
         # Verify only final insert survived
         async with pool.read_transaction() as conn:
@@ -191,45 +263,58 @@ class TestConnectionPool:
                 return "write_complete"
 
         # Run operations concurrently
-        results = await asyncio.gather(
-            read_operation(),
-            write_operation(),
-            read_operation()
-        )
+        async with asyncio.TaskGroup() as tg:
+            first_read = tg.create_task(read_operation())
+            write = tg.create_task(write_operation())
+            second_read = tg.create_task(read_operation())
+
+        assert first_read.result() == "concurrent_read"
+        assert write.result() == "write_complete"
+        assert second_read.result() == "concurrent_read"
+
+    async def test_reads_not_blocked_by_open_write(self, pool: ConnectionPool):
+        """Test reads use the reader engine and see committed data during a write."""
+        assert pool.read_engine is not pool.engine
+
+        async with pool.write_transaction() as conn:
+            await conn.execute(text("CREATE TABLE wal_test (id INTEGER)"))
 
-        assert results[0] == "concurrent_read"
-        assert results[1] == "write_complete"
-        assert results[2] == "concurrent_read"
+        async with pool.write_transaction() as write_conn:
+            await write_conn.execute(text("INSERT INTO wal_test VALUES (1)"))
+
+            # WAL readers run alongside the open write and see the last commit
+            async with pool.read_transaction() as read_conn:
+                result = await read_conn.execute(text("SELECT COUNT(*) FROM wal_test"))
+                assert result.scalar() == 0
+
+    async def test_reader_engine_shared_without_wal(self, tmp_path):
+        """Test pools without WAL keep readers on the writer engine."""
+        rollback_pool = ConnectionPool(str(tmp_path / "rollback.db"), max_connections=2)
+        await rollback_pool.initialize()
+
+        try:
+            assert rollback_pool.read_engine is rollback_pool.engine
+        finally:
+            await rollback_pool.close()
 
 
 @pytest.mark.unit
 @pytest.mark.database
+@pytest.mark.asyncio(loop_scope="module")
 class TestConnectionPoolPerformance:
     """Test connection pool performance characteristics."""
 
-    @pytest_asyncio.fixture
-    async def pool(self, temp_db_path: str):
-        """Create connection pool for performance testing."""
-        pool = ConnectionPool(db_path=temp_db_path, max_connections=5)
-        await pool.initialize()
-        yield pool
-        await pool.close()
-
     @pytest.mark.performance
     async def test_connection_pool_performance(self, pool: ConnectionPool):
         """Test connection pool performance under load."""
         import time
 
-        # Warm up the pool
-        async with pool.read_transaction() as conn:
-            await conn.execute(text("SELECT 1"))
-
         start_time = time.time()
 
         # Perform multiple operations
         for i in range(10):
             async with pool.read_transaction() as conn:
-                result = await conn.execute(text(f"SELECT {i}"))
+                result = await conn.execute(SELECT_VALUE, {"value": i})
                 result.fetchone()
 
         execution_time = time.time() - start_time
@@ -241,16 +326,18 @@ class TestConnectionPoolPerformance:
     @pytest.mark.performance
     async def test_stats_tracking_performance(self, pool: ConnectionPool):
         """Test that stats tracking doesn't significantly impact performance."""
-        import time\n        iterations = 50
+        import time
+        iterations = 50
 
         start_time = time.time()
-        for i in range(iterations):
-            async with pool.read_transaction() as conn:
-                await conn.execute(text("SELECT 1"))
+        async with pool.read_transaction() as conn:
+            for i in range(iterations):
+                await conn.execute(SELECT_ONE)
         execution_time = time.time() - start_time
 
-        # Stats should be accurately tracked
-        assert pool.stats["read_queries"] >= iterations
+        # Stats should be accurately tracked per transaction and per statement
+        assert pool.stats["read_queries"] == 1
+        assert pool.stats["statements_executed"] >= iterations
 
         # Performance should be reasonable
         avg_time_per_query = execution_time / iterations
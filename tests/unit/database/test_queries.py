@@ -2,6 +2,8 @@
 Unit tests for database query operations.
 """
 
+import json
+import math
 import pytest
 import pytest_asyncio
 from datetime import datetime
@@ -12,6 +14,8 @@ from devstream.database.queries import (
     SemanticMemoryQueries,
     WorkSessionQueries,
     QueryManager,
+    _dumps,
+    _loads,
 )
 
 
@@ -262,4 +266,52 @@ class TestQueryManager:
 
         assert len(id1) == 32
         assert len(id2) == 32
-        assert id1 != id2  # Should be unique
\ No newline at end of file
+        assert id1 != id2  # Should be unique
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestJsonColumns:
+    """Test JSON column encoding."""
+
+    def test_round_trip(self):
+        """Test column values survive an encode/decode round trip."""
+        value = {
+            "tags": ["unit", "täst"],
+            "embedding": [0.25, -1.5, 3.0],
+            "nested": {"count": 2, "enabled": True, "missing": None},
+        }
+
+        encoded = _dumps(value)
+
+        assert isinstance(encoded, str)
+        assert _loads(encoded) == value
+
+    def test_non_string_keys_stored_as_strings(self):
+        """Test int dict keys are written as strings, like stdlib json."""
+        assert _loads(_dumps({1: "a", 2: "b"})) == {"1": "a", "2": "b"}
+
+    def test_non_finite_floats_stored_as_null(self):
+        """Test NaN and Infinity are stored as null."""
+        encoded = _dumps([float("nan"), float("inf"), 1.0])
+
+        assert encoded == "[null,null,1.0]"
+        assert _loads(encoded) == [None, None, 1.0]
+
+    def test_legacy_non_finite_row_readable(self):
+        """Test rows written by stdlib json with NaN/Infinity still decode."""
+        legacy = json.dumps({"scores": [float("nan"), float("inf"), 1.0]})
+
+        scores = _loads(legacy)["scores"]
+
+        assert math.isnan(scores[0])
+        assert scores[1:] == [float("inf"), 1.0]
+
+    def test_wide_int_round_trip(self):
+        """Test ints wider than 64 bits are written and read back exactly."""
+        value = {"id": 2**70, "negative": -(2**64), "ratio": 0.5}
+
+        encoded = _dumps(value)
+
+        assert json.loads(encoded) == value
+        assert _loads(encoded) == value
@@ -6,6 +6,7 @@ processing, search e context assembly.
 """
 
 import asyncio
+import os
 import pytest
 import tempfile
 from datetime import datetime
@@ -376,4 +377,6 @@ class TestMemorySystemIntegration:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    # Quiet, cache-free runs by default; set VERBOSE=1 for per-test output
+    verbosity = ["-v"] if os.getenv("VERBOSE") else ["-q", "-p", "no:cacheprovider"]
+    pytest.main([__file__, *verbosity])
\ No newline at end of file